@@ -14,9 +14,12 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from dataclasses import dataclass, field
-from collections import deque
-from typing import Dict, List, Optional, Tuple
+from collections import Counter, defaultdict, deque
+from itertools import chain, islice
+from typing import Dict, List, Optional, Set, Tuple
+import math
 import random
+import sys
 import time
 import csv
 import threading
@@ -27,26 +30,57 @@ from datetime import datetime
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Estados de procesos (cadenas internadas: las comparaciones aciertan por identidad)
+NEW = sys.intern('NEW')
+READY = sys.intern('READY')
+RUNNING = sys.intern('RUNNING')
+BLOCKED = sys.intern('BLOCKED')
+ZOMBIE = sys.intern('ZOMBIE')
+TERMINATED = sys.intern('TERMINATED')
+
+# Estados desde los que se puede bloquear un proceso
+BLOCKABLE_STATES = frozenset((READY, RUNNING))
+
 # Colores para estados de procesos
 STATE_COLORS = {
-    'NEW': '#FFD966',        # Amarillo claro
-    'READY': '#B6D7A8',      # Verde claro
-    'RUNNING': '#9FC5E8',    # Azul/cian
-    'BLOCKED': '#E6B8AF',    # Rojo/rosado claro
-    'ZOMBIE': '#C27BA0',     # Morado
-    'TERMINATED': '#D9D9D9'  # Gris claro
+    NEW: '#FFD966',        # Amarillo claro
+    READY: '#B6D7A8',      # Verde claro
+    RUNNING: '#9FC5E8',    # Azul/cian
+    BLOCKED: '#E6B8AF',    # Rojo/rosado claro
+    ZOMBIE: '#C27BA0',     # Morado
+    TERMINATED: '#D9D9D9'  # Gris claro
 }
 
-@dataclass
+# Intervalo del bucle de redibujado de la GUI (~30 cuadros por segundo)
+RENDER_INTERVAL_MS = 33
+
+# Eventos que conserva el log del motor y cuántos muestra la GUI
+LOG_CAPACITY = 50
+LOG_VISIBLE_LINES = 10
+
+# Sangrías precalculadas para el árbol de procesos
+_INDENTS = ["  " * level for level in range(16)]
+
+# Nombres de tag del Treeview por estado
+STATE_TAG = {state: f"state_{state}" for state in STATE_COLORS}
+
+# Fragmentos de texto por estado para el árbol y el resumen
+_TREE_STATE_SUFFIX = {state: f") - {state}\n" for state in STATE_COLORS}
+_SUMMARY_STATE_PREFIX = {state: f"\n   • {state}: " for state in STATE_COLORS}
+
+# slots en dataclass solo existe desde Python 3.10; en 3.8/3.9 se usa la clase normal
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Process:
     """Clase que representa un proceso en el sistema."""
     pid: int
     name: str
-    state: str = 'NEW'
+    state: str = NEW
     total_burst: int = 0
     remaining_burst: int = 0
     parent_pid: Optional[int] = None
-    children: List[int] = field(default_factory=list)
+    children: Set[int] = field(default_factory=set)
     
     # Métricas de tiempo
     created_tick: int = 0
@@ -65,22 +99,38 @@ class Process:
 class SimulatorEngine:
     """Motor de simulación que maneja la lógica de estados de procesos."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.tick = 0
         self.pid_counter = 1
-        self.process_table: Dict[int, Process] = {}
+        self.rng = random.Random(seed)  # Generador propio: no comparte estado con el módulo random
+        self.process_table: Dict[int, Process] = {}  # Todos los procesos, para búsquedas por PID
+        # Partición de process_table: los recorridos por tick solo visitan los vivos
+        self.live: Dict[int, Process] = {}  # Procesos aún no terminados
+        self.archived: Dict[int, Process] = {}  # Procesos TERMINATED, en orden de terminación
         self.ready_queue = deque()
-        self.blocked_list = []
-        self.zombie_list = []
+        self._ready_set: set = set()  # PIDs con entrada vigente en ready_queue
+        self._ready_stale: Dict[int, int] = {}  # PID -> entradas obsoletas en ready_queue
+        # Diccionarios ordenados (PID -> None): pertenencia y borrado O(1)
+        self.blocked_list: Dict[int, None] = {}
+        self.zombie_list: Dict[int, None] = {}
+        self._zombie_children_of: Dict[int, Set[int]] = defaultdict(set)  # padre -> hijos zombie
+        self.root_pids: Dict[int, None] = {}  # Procesos sin padre existente, en orden de creación
         
         # Métricas
         self.context_switches = 0
         self.cpu_busy_ticks = 0
         self.idle_ticks = 0
+        self._total_created = 0
+        
+        # Acumuladores de procesos terminados (evitan recorrer process_table)
+        self._turnaround_sum = 0
+        self._waiting_sum = 0
+        self._finished_count = 0
         
         # Configuración
         self.quantum = 3
         self.p_block = 0.1  # Probabilidad de bloqueo
+        self._create_gap: Optional[int] = None  # Ticks sin auto-crear antes de la próxima creación
         self.p_create = 0.05  # Probabilidad de auto-crear
         self.auto_reap_after = 10  # Ticks para auto-reap
         
@@ -89,7 +139,13 @@ class SimulatorEngine:
         self.current_quantum_used = 0
         
         # Logs
-        self.event_logs = deque(maxlen=50)
+        # Buffer circular preasignado: log_seq es también el índice de escritura
+        self.event_logs: List[Optional[Tuple[int, str, tuple]]] = [None] * LOG_CAPACITY
+        self.log_seq = 0  # Total de eventos registrados (detecta cambios en el log)
+        
+        # Banderas de cambios pendientes de dibujar (las limpia la GUI)
+        self.dirty_table = self.dirty_queues = self.dirty_metrics = True
+        self.version = 0  # Se incrementa con cada cambio de estado
         
         # Crear proceso init (PID 0)
         self._create_init_process()
@@ -99,13 +155,14 @@ class SimulatorEngine:
         init_process = Process(
             pid=0,
             name="init",
-            state="RUNNING",
+            state=RUNNING,
             total_burst=999999,
             remaining_burst=999999,
             created_tick=0
         )
         self.process_table[0] = init_process
-        self.log_event(f"Proceso init (PID 0) creado")
+        self.live[0] = init_process
+        self.log_event("Proceso init (PID 0) creado")
     
     def create_process(self, name: str = None, burst: int = None, parent_pid: int = None) -> int:
         """Crea un nuevo proceso en estado NEW."""
@@ -115,12 +172,12 @@ class SimulatorEngine:
         if name is None:
             name = f"P{pid}"
         if burst is None:
-            burst = random.randint(5, 15)
+            burst = self.rng.randint(5, 15)
         
         process = Process(
             pid=pid,
             name=name,
-            state='NEW',
+            state=NEW,
             total_burst=burst,
             remaining_burst=burst,
             parent_pid=parent_pid,
@@ -128,38 +185,51 @@ class SimulatorEngine:
         )
         
         self.process_table[pid] = process
+        self.live[pid] = process
+        self._total_created += 1
         
         # Agregar como hijo al padre
-        if parent_pid and parent_pid in self.process_table:
-            self.process_table[parent_pid].children.append(pid)
+        parent = self.process_table.get(parent_pid)
+        if parent is not None and parent_pid:
+            parent.children.add(pid)
         
-        self.log_event(f"Proceso {name} (PID {pid}) creado con burst {burst}")
+        # Raíz del árbol: sin padre o con un padre inexistente
+        if parent is None:
+            self.root_pids[pid] = None
+        
+        self.log_event("Proceso %s (PID %s) creado con burst %s", name, pid, burst)
+        self._mark_dirty()
         return pid
     
     def move_new_to_ready(self):
         """Mueve todos los procesos NEW a READY."""
         moved = 0
-        for process in self.process_table.values():
-            if process.state == 'NEW':
-                process.state = 'READY'
-                self.ready_queue.append(process.pid)
+        for process in self.live.values():
+            if process.state == NEW:
+                process.state = READY
+                self._ready_push(process.pid)
                 moved += 1
-                self.log_event(f"Proceso {process.name} (PID {process.pid}) movido a READY")
+                self.log_event("Proceso %s (PID %s) movido a READY", process.name, process.pid)
+        if moved:
+            self._mark_dirty()
         return moved
     
     def force_block_process(self, pid: int, io_time: int = None):
         """Fuerza el bloqueo de un proceso."""
-        if pid not in self.process_table:
+        process = self.process_table.get(pid)
+        if process is None:
             return False
         
-        process = self.process_table[pid]
-        if process.state not in ['READY', 'RUNNING']:
+        if process.state not in BLOCKABLE_STATES:
             return False
         
         if io_time is None:
-            io_time = random.randint(2, 6)
+            io_time = self.rng.randint(2, 6)
+        
+        # Remover de ready_queue si estaba ahí
+        self._discard_from_ready(pid)
         
-        process.state = 'BLOCKED'
+        process.state = BLOCKED
         process.io_remaining = io_time
         process.blocked_count += 1
         
@@ -168,26 +238,18 @@ class SimulatorEngine:
             self.current_running_pid = None
             self.current_quantum_used = 0
         
-        # Remover de ready_queue si estaba ahí
-        if pid in self.ready_queue:
-            temp_queue = deque()
-            while self.ready_queue:
-                p = self.ready_queue.popleft()
-                if p != pid:
-                    temp_queue.append(p)
-            self.ready_queue = temp_queue
-        
-        self.blocked_list.append(pid)
-        self.log_event(f"Proceso {process.name} (PID {pid}) bloqueado por {io_time} ticks")
+        self.blocked_list[pid] = None
+        self.log_event("Proceso %s (PID %s) bloqueado por %s ticks", process.name, pid, io_time)
+        self._mark_dirty()
         return True
     
     def force_terminate_process(self, pid: int):
         """Fuerza la terminación de un proceso."""
-        if pid not in self.process_table or pid == 0:  # No terminar init
+        process = self.process_table.get(pid)
+        if process is None or pid == 0:  # No terminar init
             return False
         
-        process = self.process_table[pid]
-        if process.state == 'TERMINATED':
+        if process.state == TERMINATED:
             return False
         
         # Liberar CPU si estaba corriendo
@@ -203,66 +265,174 @@ class SimulatorEngine:
         process.end_tick = self.tick
         
         # Verificar si debe ser zombie
-        if process.parent_pid and process.parent_pid in self.process_table:
-            parent = self.process_table[process.parent_pid]
+        parent = self.process_table.get(process.parent_pid) if process.parent_pid else None
+        if parent is not None:
             if not parent.waiting_for_child:
-                process.state = 'ZOMBIE'
-                self.zombie_list.append(pid)
-                self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> ZOMBIE")
+                self._make_zombie(process)
+                self.log_event("Proceso %s (PID %s) terminado -> ZOMBIE", process.name, pid)
             else:
-                process.state = 'TERMINATED'
+                self._finalize_terminated(process)
                 process.reaped = True
-                self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
+                self.log_event("Proceso %s (PID %s) terminado -> TERMINATED", process.name, pid)
         else:
-            process.state = 'TERMINATED'
-            self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
+            self._finalize_terminated(process)
+            self.log_event("Proceso %s (PID %s) terminado -> TERMINATED", process.name, pid)
         
+        self._mark_dirty()
         return True
     
+    def set_seed(self, seed: Optional[int]):
+        """Reinicia el generador aleatorio del motor con una semilla."""
+        self.rng.seed(seed)
+    
+    @property
+    def p_create(self) -> float:
+        """Probabilidad de auto-crear un proceso en cada tick."""
+        return self._p_create
+    
+    @p_create.setter
+    def p_create(self, probability: float):
+        # El salto ya sorteado corresponde a la probabilidad anterior
+        self._p_create = probability
+        self._create_gap = None
+    
+    def _mark_dirty(self):
+        """Indica a la GUI que la tabla, las colas y las métricas cambiaron."""
+        self.dirty_table = self.dirty_queues = self.dirty_metrics = True
+        self.version += 1
+    
+    def _finalize_terminated(self, process: Process):
+        """Marca un proceso como TERMINATED y acumula sus métricas una sola vez."""
+        if process.state == TERMINATED:
+            return
+        process.state = TERMINATED
+        self.archived[process.pid] = self.live.pop(process.pid)
+        
+        if process.end_tick and process.created_tick:
+            turnaround = process.end_tick - process.created_tick
+            self._turnaround_sum += turnaround
+            # Tiempo de espera = turnaround - tiempo de ejecución
+            self._waiting_sum += max(0, turnaround - process.total_burst)
+            self._finished_count += 1
+    
     def wait_for_child(self, parent_pid: int) -> List[int]:
         """Implementa la llamada wait() para reapear procesos zombie."""
-        if parent_pid not in self.process_table:
+        parent = self.process_table.get(parent_pid)
+        if parent is None:
             return []
         
-        parent = self.process_table[parent_pid]
         reaped_children = []
         
-        # Buscar hijos zombie
-        for child_pid in parent.children[:]:  # Copia para modificar durante iteración
-            if child_pid in self.process_table:
-                child = self.process_table[child_pid]
-                if child.state == 'ZOMBIE':
-                    child.state = 'TERMINATED'
-                    child.reaped = True
-                    if child_pid in self.zombie_list:
-                        self.zombie_list.remove(child_pid)
-                    reaped_children.append(child_pid)
-                    self.log_event(f"Proceso {child.name} (PID {child_pid}) reapeado por padre {parent.name}")
-        
+        # Solo los hijos zombie de este padre (índice inverso)
+        for child_pid in sorted(self._zombie_children_of.pop(parent_pid, ())):
+            child = self.process_table.get(child_pid)
+            if child is not None and child.state == ZOMBIE:
+                self._finalize_terminated(child)
+                child.reaped = True
+                self.zombie_list.pop(child_pid, None)
+                reaped_children.append(child_pid)
+                self.log_event("Proceso %s (PID %s) reapeado por padre %s", child.name, child_pid, parent.name)
+        
+        if reaped_children:
+            self._mark_dirty()
         return reaped_children
     
     def _remove_from_queues(self, pid: int):
         """Remueve un proceso de todas las colas."""
         # Remover de ready_queue
-        if pid in self.ready_queue:
-            temp_queue = deque()
-            while self.ready_queue:
-                p = self.ready_queue.popleft()
-                if p != pid:
-                    temp_queue.append(p)
-            self.ready_queue = temp_queue
+        self._discard_from_ready(pid)
         
         # Remover de blocked_list
-        if pid in self.blocked_list:
-            self.blocked_list.remove(pid)
+        self.blocked_list.pop(pid, None)
         
         # Remover de zombie_list
-        if pid in self.zombie_list:
-            self.zombie_list.remove(pid)
+        self._drop_zombie(pid)
+    
+    def _make_zombie(self, process: Process):
+        """Pasa un proceso a ZOMBIE y lo indexa bajo su padre."""
+        process.state = ZOMBIE
+        self.zombie_list[process.pid] = None
+        if process.parent_pid is not None:
+            self._zombie_children_of[process.parent_pid].add(process.pid)
+    
+    def _drop_zombie(self, pid: int):
+        """Quita un PID de zombie_list y del índice de hijos zombie."""
+        if pid not in self.zombie_list:
+            return
+        del self.zombie_list[pid]
+        process = self.process_table.get(pid)
+        if process is None or process.parent_pid is None:
+            return
+        siblings = self._zombie_children_of.get(process.parent_pid)
+        if siblings is not None:
+            siblings.discard(pid)
+            if not siblings:
+                del self._zombie_children_of[process.parent_pid]
+    
+    def _ready_push(self, pid: int):
+        """Encola un PID en ready_queue registrando su pertenencia."""
+        self.ready_queue.append(pid)
+        self._ready_set.add(pid)
+    
+    def _discard_from_ready(self, pid: int):
+        """Marca la entrada de un PID en ready_queue como obsoleta (borrado perezoso)."""
+        if pid not in self._ready_set:
+            return
+        self._ready_set.discard(pid)
+        self._ready_stale[pid] = self._ready_stale.get(pid, 0) + 1
+    
+    def _pop_ready(self) -> Optional[int]:
+        """Extrae el siguiente PID válido de ready_queue, descartando obsoletos."""
+        while self.ready_queue:
+            pid = self.ready_queue.popleft()
+            stale = self._ready_stale.get(pid)
+            if stale:
+                if stale == 1:
+                    del self._ready_stale[pid]
+                else:
+                    self._ready_stale[pid] = stale - 1
+                continue
+            self._ready_set.discard(pid)
+            return pid
+        return None
+    
+    def iter_ready(self):
+        """Itera los PIDs vigentes de ready_queue en orden."""
+        # Las entradas obsoletas de un PID siempre preceden a su entrada vigente
+        skip = dict(self._ready_stale)
+        for pid in self.ready_queue:
+            if skip.get(pid):
+                skip[pid] -= 1
+                continue
+            yield pid
+    
+    def advance(self, ticks: int = 1, auto_create: bool = False):
+        """Avanza varios ticks; con auto_create crea procesos con probabilidad p_create por tick."""
+        for _ in range(ticks):
+            if auto_create and self._should_auto_create():
+                self.create_process()
+            self.tick_simulation()
+    
+    def _should_auto_create(self) -> bool:
+        """Sorteo Bernoulli(p_create) del tick actual mediante saltos geométricos."""
+        if self.p_create <= 0:
+            return False
+        if self._create_gap is None:
+            # Número de ticks sin creación antes de la siguiente: un solo sorteo por creación
+            if self.p_create >= 1:
+                self._create_gap = 0
+            else:
+                self._create_gap = int(math.log(1.0 - self.rng.random()) / math.log(1.0 - self.p_create))
+        if self._create_gap == 0:
+            self._create_gap = None
+            return True
+        self._create_gap -= 1
+        return False
     
     def tick_simulation(self):
         """Ejecuta un tick de simulación."""
         self.tick += 1
+        self._mark_dirty()
         
         # 1. Gestionar procesos bloqueados
         self._handle_blocked_processes()
@@ -282,31 +452,34 @@ class SimulatorEngine:
     
     def _handle_blocked_processes(self):
         """Maneja los procesos bloqueados."""
+        # Referencias locales: evita búsquedas de atributos por proceso en el bucle
+        get_process = self.process_table.get
+        ready_push = self._ready_push
         unblocked = []
-        for pid in self.blocked_list[:]:  # Copia para modificar durante iteración
-            if pid in self.process_table:
-                process = self.process_table[pid]
-                if process.io_remaining > 0:
-                    process.io_remaining -= 1
-                    if process.io_remaining == 0:
-                        process.state = 'READY'
-                        self.ready_queue.append(pid)
-                        unblocked.append(pid)
-                        self.log_event(f"Proceso {process.name} (PID {pid}) desbloqueado -> READY")
-        
-        # Remover de blocked_list
+        for pid in self.blocked_list:
+            process = get_process(pid)
+            if process is None or process.io_remaining <= 0:
+                continue
+            process.io_remaining -= 1
+            if process.io_remaining == 0:
+                process.state = READY
+                ready_push(pid)
+                unblocked.append(pid)
+                self.log_event("Proceso %s (PID %s) desbloqueado -> READY", process.name, pid)
+        
+        # Remover de blocked_list (fuera del bucle: no se modifica durante la iteración)
         for pid in unblocked:
-            self.blocked_list.remove(pid)
+            del self.blocked_list[pid]
     
     def _schedule_processes(self):
         """Implementa el scheduler Round-Robin."""
         # Si no hay proceso corriendo y hay procesos en ready
-        if self.current_running_pid is None and self.ready_queue:
+        if self.current_running_pid is None and self._ready_set:
             # Tomar siguiente proceso de la cola
-            pid = self.ready_queue.popleft()
-            if pid in self.process_table:
-                process = self.process_table[pid]
-                process.state = 'RUNNING'
+            pid = self._pop_ready()
+            process = self.process_table.get(pid) if pid is not None else None
+            if process is not None:
+                process.state = RUNNING
                 self.current_running_pid = pid
                 self.current_quantum_used = 0
                 self.context_switches += 1
@@ -314,7 +487,7 @@ class SimulatorEngine:
                 if process.start_tick is None:
                     process.start_tick = self.tick
                 
-                self.log_event(f"Proceso {process.name} (PID {pid}) ejecutándose")
+                self.log_event("Proceso %s (PID %s) ejecutándose", process.name, pid)
         
         # Ejecutar proceso actual
         if self.current_running_pid is not None:
@@ -325,107 +498,109 @@ class SimulatorEngine:
     def _execute_current_process(self):
         """Ejecuta el proceso actual por un sub-tick."""
         pid = self.current_running_pid
-        if pid not in self.process_table:
+        process = self.process_table.get(pid)
+        if process is None:
             self.current_running_pid = None
             return
         
-        process = self.process_table[pid]
         self.cpu_busy_ticks += 1
-        self.current_quantum_used += 1
+        used = self.current_quantum_used = self.current_quantum_used + 1
         
         # Decrementar burst
-        process.remaining_burst -= 1
+        remaining = process.remaining_burst = process.remaining_burst - 1
+        
+        # Camino rápido (caso común): no termina, no se bloquea y no agota el quantum.
+        # Sin probabilidad de bloqueo no se consume el generador aleatorio
+        blocked = False
+        if remaining > 0:
+            blocked = self.p_block > 0 and self.rng.random() < self.p_block
+            if not blocked and used < self.quantum:
+                return
         
         # Verificar si el proceso termina
-        if process.remaining_burst <= 0:
+        if remaining <= 0:
             process.end_tick = self.tick
             self.current_running_pid = None
             self.current_quantum_used = 0
             
             # Verificar si debe ser zombie
-            if process.parent_pid and process.parent_pid in self.process_table:
-                parent = self.process_table[process.parent_pid]
+            parent = self.process_table.get(process.parent_pid) if process.parent_pid else None
+            if parent is not None:
                 if not parent.waiting_for_child:
-                    process.state = 'ZOMBIE'
-                    self.zombie_list.append(pid)
-                    self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> ZOMBIE")
+                    self._make_zombie(process)
+                    self.log_event("Proceso %s (PID %s) terminado -> ZOMBIE", process.name, pid)
                 else:
-                    process.state = 'TERMINATED'
+                    self._finalize_terminated(process)
                     process.reaped = True
-                    self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
+                    self.log_event("Proceso %s (PID %s) terminado -> TERMINATED", process.name, pid)
             else:
-                process.state = 'TERMINATED'
-                self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
+                self._finalize_terminated(process)
+                self.log_event("Proceso %s (PID %s) terminado -> TERMINATED", process.name, pid)
             return
         
         # Verificar bloqueo aleatorio
-        if random.random() < self.p_block:
-            io_time = random.randint(2, 5)
-            process.state = 'BLOCKED'
+        if blocked:
+            io_time = self.rng.randrange(2, 6)
+            process.state = BLOCKED
             process.io_remaining = io_time
             process.blocked_count += 1
-            self.blocked_list.append(pid)
+            self.blocked_list[pid] = None
             self.current_running_pid = None
             self.current_quantum_used = 0
-            self.log_event(f"Proceso {process.name} (PID {pid}) bloqueado aleatoriamente por {io_time} ticks")
+            self.log_event("Proceso %s (PID %s) bloqueado aleatoriamente por %s ticks", process.name, pid, io_time)
             return
         
-        # Verificar preempción por quantum
-        if self.current_quantum_used >= self.quantum:
-            process.state = 'READY'
-            process.preempt_count += 1
-            self.ready_queue.append(pid)
-            self.current_running_pid = None
-            self.current_quantum_used = 0
-            self.context_switches += 1
-            self.log_event(f"Proceso {process.name} (PID {pid}) preemptado -> READY")
+        # Preempción por quantum (único caso restante)
+        process.state = READY
+        process.preempt_count += 1
+        self._ready_push(pid)
+        self.current_running_pid = None
+        self.current_quantum_used = 0
+        self.context_switches += 1
+        self.log_event("Proceso %s (PID %s) preemptado -> READY", process.name, pid)
     
     def _auto_reap_zombies(self):
         """Auto-reapea zombies después de N ticks."""
-        for pid in self.zombie_list[:]:  # Copia para modificar
-            if pid in self.process_table:
-                process = self.process_table[pid]
-                if process.end_tick and (self.tick - process.end_tick) >= self.auto_reap_after:
-                    process.state = 'TERMINATED'
-                    process.reaped = True
-                    self.zombie_list.remove(pid)
-                    self.log_event(f"Proceso {process.name} (PID {pid}) auto-reapeado")
+        for pid in list(self.zombie_list):  # Copia para modificar
+            process = self.process_table.get(pid)
+            if process is None:
+                continue
+            if process.end_tick and (self.tick - process.end_tick) >= self.auto_reap_after:
+                self._finalize_terminated(process)
+                process.reaped = True
+                self._drop_zombie(pid)
+                self.log_event("Proceso %s (PID %s) auto-reapeado", process.name, pid)
+    
+    def log_event(self, message: str, *args):
+        """Registra un evento en el log (el texto se formatea al mostrarlo)."""
+        self.event_logs[self.log_seq % LOG_CAPACITY] = (self.tick, message, args)
+        self.log_seq += 1
     
-    def log_event(self, message: str):
-        """Registra un evento en el log."""
-        timestamp = f"Tick {self.tick:04d}"
-        self.event_logs.append(f"[{timestamp}] {message}")
+    def recent_logs(self, count: int) -> List[str]:
+        """Devuelve las últimas `count` entradas del log ya formateadas."""
+        logs = self.event_logs
+        end = self.log_seq
+        start = max(0, end - min(count, LOG_CAPACITY))
+        entries = (logs[i % LOG_CAPACITY] for i in range(start, end))
+        return [
+            f"[Tick {tick:04d}] {message % args if args else message}"
+            for tick, message, args in entries
+        ]
     
     def get_metrics(self) -> Dict:
         """Calcula y retorna métricas del sistema."""
-        total_processes = len([p for p in self.process_table.values() if p.pid != 0])
-        terminated_processes = [p for p in self.process_table.values() 
-                              if p.state == 'TERMINATED' and p.pid != 0]
-        
         cpu_utilization = (self.cpu_busy_ticks / max(self.tick, 1)) * 100
-        
-        turnaround_times = []
-        waiting_times = []
-        
-        for process in terminated_processes:
-            if process.end_tick and process.created_tick:
-                turnaround = process.end_tick - process.created_tick
-                turnaround_times.append(turnaround)
-                
-                # Tiempo de espera = turnaround - tiempo de ejecución
-                execution_time = process.total_burst
-                waiting_time = turnaround - execution_time
-                waiting_times.append(max(0, waiting_time))
+        finished = self._finished_count
         
         return {
             'tick': self.tick,
-            'total_processes': total_processes,
+            'total_processes': self._total_created,
             'cpu_utilization': cpu_utilization,
             'context_switches': self.context_switches,
             'zombies_count': len(self.zombie_list),
-            'avg_turnaround': sum(turnaround_times) / len(turnaround_times) if turnaround_times else 0,
-            'avg_waiting': sum(waiting_times) / len(waiting_times) if waiting_times else 0,
-            'ready_queue_size': len(self.ready_queue),
+            'avg_turnaround': self._turnaround_sum / finished if finished else 0,
+            'avg_waiting': self._waiting_sum / finished if finished else 0,
+            'ready_queue_size': len(self._ready_set),
             'blocked_count': len(self.blocked_list)
         }
 
@@ -439,6 +614,12 @@ class ProcessSimulatorGUI:
         
         # Motor de simulación
         self.engine = SimulatorEngine()
+        self._tree_rows: Dict[int, tuple] = {}  # PID -> valores mostrados en su fila (iid = str(PID))
+        self._rows_engine: Optional[SimulatorEngine] = None  # Motor cuyas filas muestra la tabla
+        self._archived_drawn = 0  # Procesos archivados cuya fila final ya se dibujó
+        self._last_log_seq = -1  # log_seq del motor ya mostrado
+        self._tree_cache: Optional[Tuple[SimulatorEngine, int, str]] = None  # (motor, versión, texto)
+        self._summary_cache: Optional[Tuple[SimulatorEngine, tuple, str]] = None  # (motor, clave, texto)
         
         # Variables de control
         self.auto_mode = tk.BooleanVar(value=False)
@@ -451,12 +632,28 @@ class ProcessSimulatorGUI:
         # Queue para comunicación con threads
         self.update_queue = queue.Queue()
         
+        # Hilo del motor en modo automático; el lock protege al motor entre hilos
+        self.engine_lock = threading.RLock()
+        self._engine_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
+        # Copia de la configuración de Tk (las variables de Tk solo se leen en el hilo de la GUI);
+        # se actualiza al escribir cada variable, no en cada tick ni en cada cuadro
+        self._auto_enabled = False
+        self._auto_create = False
+        self._tick_delay = self.speed_var.get()
+        self._quantum = self.quantum_var.get()
+        self._bind_setting(self.auto_mode, '_auto_enabled')
+        self._bind_setting(self.auto_create_var, '_auto_create')
+        self._bind_setting(self.speed_var, '_tick_delay')
+        self._bind_setting(self.quantum_var, '_quantum')
+        
         self._setup_ui()
         self._create_initial_processes()
         self._update_display()
         
         # Configurar seed inicial
-        random.seed(42)
+        self.engine.set_seed(42)
     
     def _setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -591,6 +788,10 @@ class ProcessSimulatorGUI:
         v_scrollbar.pack(side="right", fill="y")
         h_scrollbar.pack(side="bottom", fill="x")
         
+        # Colores por estado (tags configurados una sola vez)
+        for state, color in STATE_COLORS.items():
+            self.tree.tag_configure(STATE_TAG[state], background=color, foreground="black")
+        
         # Bind selección
         self.tree.bind('<<TreeviewSelect>>', self._on_process_select)
     
@@ -674,26 +875,62 @@ class ProcessSimulatorGUI:
         self.engine.log_event("5 procesos iniciales creados")
     
     def _update_display(self):
-        """Actualiza toda la interfaz."""
-        self._update_process_table()
-        self._update_metrics()
-        self._update_queues()
-        self._update_logs()
+        """Actualiza las partes de la interfaz que cambiaron."""
+        # Un único redibujado por cuadro, sin importar cuántos ticks hubo entre medio
+        engine = self.engine
+        if (engine.dirty_table or engine.dirty_metrics or engine.dirty_queues
+                or engine.log_seq != self._last_log_seq):
+            with self.engine_lock:
+                engine = self.engine
+                if engine.dirty_table:
+                    self._update_process_table()
+                    engine.dirty_table = False
+                if engine.dirty_metrics:
+                    self._update_metrics()
+                    engine.dirty_metrics = False
+                if engine.dirty_queues:
+                    self._update_queues()
+                    engine.dirty_queues = False
+                self._update_logs()
+        
+        # Mostrar errores del hilo del motor
+        try:
+            while True:
+                error = self.update_queue.get_nowait()
+                messagebox.showerror("Error en la simulación", str(error))
+        except queue.Empty:
+            pass
         
         # Programar siguiente actualización
-        self.root.after(100, self._update_display)
+        self.root.after(RENDER_INTERVAL_MS, self._update_display)
     
     def _update_process_table(self):
-        """Actualiza la tabla de procesos."""
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Agregar procesos (excepto init)
-        for process in self.engine.process_table.values():
-            if process.pid == 0:  # Skip init process
+        """Actualiza la tabla de procesos (solo filas nuevas, cambiadas o eliminadas)."""
+        # Referencias locales para el bucle por fila
+        tree = self.tree
+        tree_rows = self._tree_rows
+        state_tag = STATE_TAG
+        engine = self.engine
+        selected_pid = getattr(self, 'selected_pid', None)
+        
+        # Tras un reset el motor es otro: se descartan todas las filas
+        if self._rows_engine is not engine:
+            tree.delete(*tree.get_children())
+            tree_rows.clear()
+            self._rows_engine = engine
+            self._archived_drawn = 0
+        
+        # Los procesos terminados no cambian: solo se visitan los vivos y los
+        # archivados desde el último dibujado (los más recientes del diccionario)
+        archived = engine.archived
+        newly_archived = list(islice(reversed(archived.values()), len(archived) - self._archived_drawn))
+        newly_archived.reverse()
+        self._archived_drawn = len(archived)
+        
+        for process in chain(engine.live.values(), newly_archived):
+            pid = process.pid
+            if pid == 0:  # Skip init process
                 continue
-                
             values = (
                 process.pid,
                 process.name,
@@ -708,19 +945,22 @@ class ProcessSimulatorGUI:
                 process.blocked_count,
                 process.preempt_count
             )
+            # Filas sin cambios: no se envía nada a Tk
+            shown = tree_rows.get(pid)
+            if shown == values:
+                continue
+            tree_rows[pid] = values
+            tags = (state_tag[process.state],)
             
-            item = self.tree.insert('', 'end', values=values)
-            
-            # Aplicar color según estado
-            if process.state in STATE_COLORS:
-                self.tree.set(item, 'Estado', process.state)
-                # Configurar tag para color
-                tag = f"state_{process.state}"
-                self.tree.item(item, tags=(tag,))
-                
-                # Configurar color del tag
-                color = STATE_COLORS[process.state]
-                self.tree.tag_configure(tag, background=color, foreground="black")
+            # El iid de cada fila es el PID: la selección lo entrega directamente
+            if shown is None:
+                tree.insert('', 'end', iid=str(pid), values=values, tags=tags)
+            else:
+                tree.item(str(pid), values=values, tags=tags)
+                # La selección se conserva: refrescar su descripción si cambió
+                if pid == selected_pid:
+                    self.selected_info.configure(
+                        text=f"Seleccionado: {process.name} (PID {pid})\nEstado: {process.state}")
     
     def _update_metrics(self):
         """Actualiza las métricas del sistema."""
@@ -741,26 +981,31 @@ class ProcessSimulatorGUI:
     
     def _update_queues(self):
         """Actualiza la información de colas."""
+        engine = self.engine
+        get_process = engine.process_table.get
+        
         ready_names = []
-        for pid in self.engine.ready_queue:
-            if pid in self.engine.process_table:
-                ready_names.append(f"{self.engine.process_table[pid].name}({pid})")
+        for pid in engine.iter_ready():
+            process = get_process(pid)
+            if process is not None:
+                ready_names.append(f"{process.name}({pid})")
         
         blocked_info = []
-        for pid in self.engine.blocked_list:
-            if pid in self.engine.process_table:
-                process = self.engine.process_table[pid]
+        for pid in engine.blocked_list:
+            process = get_process(pid)
+            if process is not None:
                 blocked_info.append(f"{process.name}({pid}): {process.io_remaining}")
         
         zombie_names = []
-        for pid in self.engine.zombie_list:
-            if pid in self.engine.process_table:
-                zombie_names.append(f"{self.engine.process_table[pid].name}({pid})")
+        for pid in engine.zombie_list:
+            process = get_process(pid)
+            if process is not None:
+                zombie_names.append(f"{process.name}({pid})")
         
         current_running = "Ninguno"
-        if self.engine.current_running_pid and self.engine.current_running_pid in self.engine.process_table:
-            process = self.engine.process_table[self.engine.current_running_pid]
-            current_running = f"{process.name}({process.pid}) - Q:{self.engine.current_quantum_used}/{self.engine.quantum}"
+        process = get_process(engine.current_running_pid) if engine.current_running_pid else None
+        if process is not None:
+            current_running = f"{process.name}({process.pid}) - Q:{engine.current_quantum_used}/{engine.quantum}"
         
         text = f"""🏃 EJECUTANDO:
 {current_running}
@@ -778,13 +1023,22 @@ class ProcessSimulatorGUI:
         self.queues_text.insert("1.0", text)
     
     def _update_logs(self):
-        """Actualiza el log de eventos."""
-        # Mostrar últimos 10 eventos
-        recent_logs = list(self.engine.event_logs)[-10:]
-        log_text = "\n".join(recent_logs)
+        """Actualiza el log de eventos si hubo eventos nuevos."""
+        new_events = self.engine.log_seq - self._last_log_seq
+        if new_events == 0:
+            return
         
-        self.log_text.delete("1.0", "end")
-        self.log_text.insert("1.0", log_text)
+        if self._last_log_seq <= 0 or not 0 < new_events < LOG_VISIBLE_LINES:
+            # Primera vez, reinicio o demasiados eventos: reescribir las últimas líneas
+            self.log_text.delete("1.0", "end")
+            self.log_text.insert("1.0", "\n".join(self.engine.recent_logs(LOG_VISIBLE_LINES)))
+        else:
+            # Agregar solo los eventos nuevos y recortar las líneas más antiguas
+            self.log_text.insert("end", "\n" + "\n".join(self.engine.recent_logs(new_events)))
+            lines = int(self.log_text.index("end-1c").split(".")[0])
+            if lines > LOG_VISIBLE_LINES:
+                self.log_text.delete("1.0", f"{lines - LOG_VISIBLE_LINES + 1}.0")
+        self._last_log_seq = self.engine.log_seq
         
         # Auto-scroll al final
         self.log_text.see("end")
@@ -793,11 +1047,10 @@ class ProcessSimulatorGUI:
         """Maneja la selección de un proceso en la tabla."""
         selection = self.tree.selection()
         if selection:
-            item = selection[0]
-            pid = int(self.tree.item(item)['values'][0])
+            pid = int(selection[0])  # iid = PID
             
-            if pid in self.engine.process_table:
-                process = self.engine.process_table[pid]
+            process = self.engine.process_table.get(pid)
+            if process is not None:
                 info = f"Seleccionado: {process.name} (PID {pid})\nEstado: {process.state}"
                 self.selected_info.configure(text=info)
                 self.selected_pid = pid
@@ -810,55 +1063,82 @@ class ProcessSimulatorGUI:
     
     # Métodos de control de simulación
     def _start_auto(self):
-        """Inicia el modo automático."""
+        """Inicia el modo automático en un hilo del motor."""
         if not self.is_running:
             self.is_running = True
             self.auto_mode.set(True)
-            self._auto_tick()
+            
+            self._stop_event = threading.Event()
+            self._engine_thread = threading.Thread(target=self._engine_loop,
+                                                   args=(self._stop_event,), daemon=True)
+            self._engine_thread.start()
             self.start_btn.configure(text="🏃 Ejecutando...")
     
     def _pause_auto(self):
         """Pausa el modo automático."""
         self.is_running = False
+        self._stop_event.set()
         self.start_btn.configure(text="▶️ Start Auto")
     
+    def _bind_setting(self, var: tk.Variable, attr: str):
+        """Mantiene `attr` sincronizado con una variable de Tk mediante un trace."""
+        def on_write(*_):
+            try:
+                setattr(self, attr, var.get())
+            except tk.TclError:
+                pass  # Valor inválido mientras se edita: se conserva el anterior
+        var.trace_add("write", on_write)
+    
+    def _engine_loop(self, stop_event: threading.Event):
+        """Bucle del motor en segundo plano mientras el modo automático esté activo."""
+        while not stop_event.is_set() and self._auto_enabled:
+            # Con retardos menores que un cuadro se agrupan varios ticks por despertar
+            delay = self._tick_delay
+            ticks = 1
+            if delay * 1000 < RENDER_INTERVAL_MS:
+                ticks = math.ceil(RENDER_INTERVAL_MS / max(delay * 1000, 1))
+                delay = RENDER_INTERVAL_MS / 1000
+            try:
+                with self.engine_lock:
+                    self._auto_tick(ticks)
+            except Exception as e:
+                self.update_queue.put(e)
+                break
+            stop_event.wait(delay)
+    
     def _reset_simulation(self):
         """Reinicia la simulación."""
         result = messagebox.askyesno("Confirmar Reset", 
                                    "¿Estás seguro de que quieres reiniciar la simulación?")
         if result:
             self.is_running = False
-            self.engine = SimulatorEngine()
-            self._create_initial_processes()
+            self._stop_event.set()
+            with self.engine_lock:
+                self.engine = SimulatorEngine()
+                self._last_log_seq = -1
+                self._create_initial_processes()
             self.start_btn.configure(text="▶️ Start Auto")
     
-    def _auto_tick(self):
-        """Ejecuta ticks automáticos."""
-        if self.is_running and self.auto_mode.get():
-            # Actualizar configuraciones
-            self.engine.quantum = self.quantum_var.get()
-            
-            # Auto-crear procesos si está habilitado
-            if self.auto_create_var.get() and random.random() < self.engine.p_create:
-                self.engine.create_process()
-            
-            # Ejecutar tick
-            self.engine.tick_simulation()
-            
-            # Programar siguiente tick
-            delay = int(self.speed_var.get() * 1000)  # Convertir a ms
-            self.root.after(delay, self._auto_tick)
+    def _auto_tick(self, ticks: int = 1):
+        """Ejecuta ticks automáticos (desde el hilo del motor, con el lock tomado)."""
+        # Actualizar configuraciones
+        self.engine.quantum = self._quantum
+        
+        # Ejecutar los ticks (con auto-creación si está habilitada)
+        self.engine.advance(ticks, self._auto_create)
     
     def _manual_tick(self):
         """Ejecuta un tick manual."""
-        self.engine.quantum = self.quantum_var.get()
-        self.engine.tick_simulation()
+        with self.engine_lock:
+            self.engine.quantum = self._quantum
+            self.engine.tick_simulation()
     
     def _apply_seed(self):
         """Aplica una nueva semilla."""
         try:
             seed = int(self.seed_var.get())
-            random.seed(seed)
+            with self.engine_lock:
+                self.engine.set_seed(seed)
             messagebox.showinfo("Seed Aplicada", f"Semilla {seed} aplicada correctamente")
         except ValueError:
             messagebox.showerror("Error", "La semilla debe ser un número entero")
@@ -902,7 +1182,8 @@ class ProcessSimulatorGUI:
                 messagebox.showerror("Error", "Los valores numéricos deben ser enteros")
                 return
             
-            pid = self.engine.create_process(name, burst, parent)
+            with self.engine_lock:
+                pid = self.engine.create_process(name, burst, parent)
             messagebox.showinfo("Éxito", f"Proceso creado con PID {pid}")
             dialog.destroy()
         
@@ -943,7 +1224,8 @@ class ProcessSimulatorGUI:
                 messagebox.showerror("Error", "El burst debe ser un entero")
                 return
             
-            pid = self.engine.create_process(name, burst, self.selected_pid)
+            with self.engine_lock:
+                pid = self.engine.create_process(name, burst, self.selected_pid)
             messagebox.showinfo("Éxito", f"Proceso hijo creado con PID {pid}")
             dialog.destroy()
         
@@ -952,7 +1234,8 @@ class ProcessSimulatorGUI:
     
     def _move_new_to_ready(self):
         """Mueve todos los procesos NEW a READY."""
-        moved = self.engine.move_new_to_ready()
+        with self.engine_lock:
+            moved = self.engine.move_new_to_ready()
         messagebox.showinfo("Resultado", f"{moved} procesos movidos a READY")
     
     def _force_block_dialog(self):
@@ -981,7 +1264,8 @@ class ProcessSimulatorGUI:
                 if io_time <= 0:
                     raise ValueError
                 
-                success = self.engine.force_block_process(self.selected_pid, io_time)
+                with self.engine_lock:
+                    success = self.engine.force_block_process(self.selected_pid, io_time)
                 if success:
                     messagebox.showinfo("Éxito", f"Proceso bloqueado por {io_time} ticks")
                 else:
@@ -1003,7 +1287,8 @@ class ProcessSimulatorGUI:
         result = messagebox.askyesno("Confirmar Terminación", 
                                    f"¿Terminar el proceso {process.name} (PID {self.selected_pid})?")
         if result:
-            success = self.engine.force_terminate_process(self.selected_pid)
+            with self.engine_lock:
+                success = self.engine.force_terminate_process(self.selected_pid)
             if success:
                 messagebox.showinfo("Éxito", "Proceso terminado")
             else:
@@ -1015,7 +1300,8 @@ class ProcessSimulatorGUI:
             messagebox.showwarning("Advertencia", "Selecciona un proceso padre primero")
             return
         
-        reaped = self.engine.wait_for_child(self.selected_pid)
+        with self.engine_lock:
+            reaped = self.engine.wait_for_child(self.selected_pid)
         if reaped:
             names = [self.engine.process_table[pid].name for pid in reaped]
             messagebox.showinfo("Éxito", f"Procesos reapeados: {', '.join(names)}")
@@ -1037,37 +1323,61 @@ class ProcessSimulatorGUI:
         text_widget.insert("1.0", tree_text)
     
     def _build_process_tree(self) -> str:
+        """Devuelve el árbol de procesos, reutilizándolo si el motor no cambió."""
+        with self.engine_lock:
+            engine = self.engine
+            cached = self._tree_cache
+            if cached is not None and cached[0] is engine and cached[1] == engine.version:
+                return cached[2]
+            
+            tree = self._render_process_tree()
+            self._tree_cache = (engine, engine.version, tree)
+            return tree
+    
+    def _render_process_tree(self) -> str:
         """Construye una representación textual del árbol de procesos."""
-        def build_subtree(pid, level=0):
-            if pid not in self.engine.process_table:
-                return ""
+        process_table = self.engine.process_table
+        parts = ["🌳 ÁRBOL DE PROCESOS\n\n"]
+        
+        # DFS iterativo con pila explícita (sin límite de recursión en cadenas profundas)
+        stack = [(root_pid, 0) for root_pid in reversed(self.engine.root_pids)]
+        while stack:
+            pid, level = stack.pop()
+            process = process_table.get(pid)
+            if process is None:
+                continue
             
-            process = self.engine.process_table[pid]
-            indent = "  " * level
+            indent = _INDENTS[level] if level < len(_INDENTS) else "  " * level
             symbol = "├─" if level > 0 else ""
+            parts.append(f"{indent}{symbol} {process.name} (PID {pid}{_TREE_STATE_SUFFIX[process.state]}")
             
-            result = f"{indent}{symbol} {process.name} (PID {pid}) - {process.state}\n"
-            
-            # Agregar hijos
-            for child_pid in process.children:
-                result += build_subtree(child_pid, level + 1)
-            
-            return result
-        
-        tree = "🌳 ÁRBOL DE PROCESOS\n\n"
+            # Hijos en orden inverso para que salgan de menor a mayor PID
+            stack.extend((child_pid, level + 1) for child_pid in sorted(process.children, reverse=True))
         
-        # Encontrar procesos raíz (sin padre o padre inexistente)
-        root_processes = []
+        return "".join(parts)
+    
+    def _iter_process_rows(self):
+        """Genera las filas CSV de los procesos (excepto init)."""
         for process in self.engine.process_table.values():
             if process.pid == 0:  # Skip init
                 continue
-            if process.parent_pid is None or process.parent_pid not in self.engine.process_table:
-                root_processes.append(process.pid)
-        
-        for root_pid in root_processes:
-            tree += build_subtree(root_pid)
-        
-        return tree
+            
+            turnaround = (process.end_tick - process.created_tick) if process.end_tick else None
+            waiting_time = (turnaround - process.total_burst) if turnaround else None
+            
+            yield (
+                process.pid,
+                process.name,
+                process.state,
+                process.total_burst,
+                process.created_tick,
+                process.start_tick or '',
+                process.end_tick or '',
+                turnaround or '',
+                waiting_time or '',
+                process.blocked_count,
+                process.preempt_count
+            )
     
     def _export_csv(self):
         """Exporta métricas a CSV."""
@@ -1079,7 +1389,12 @@ class ProcessSimulatorGUI:
         
         if filename:
             try:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                # Copiar los datos bajo el lock; la escritura no bloquea al motor
+                with self.engine_lock:
+                    rows = list(self._iter_process_rows())
+                    metrics = self.engine.get_metrics()
+                
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                     writer = csv.writer(csvfile)
                     
                     # Header
@@ -1088,33 +1403,12 @@ class ProcessSimulatorGUI:
                                    'Bloqueos', 'Preempciones'])
                     
                     # Datos de procesos
-                    for process in self.engine.process_table.values():
-                        if process.pid == 0:  # Skip init
-                            continue
-                        
-                        turnaround = (process.end_tick - process.created_tick) if process.end_tick else None
-                        waiting_time = (turnaround - process.total_burst) if turnaround else None
-                        
-                        writer.writerow([
-                            process.pid,
-                            process.name,
-                            process.state,
-                            process.total_burst,
-                            process.created_tick,
-                            process.start_tick or '',
-                            process.end_tick or '',
-                            turnaround or '',
-                            waiting_time or '',
-                            process.blocked_count,
-                            process.preempt_count
-                        ])
+                    writer.writerows(rows)
                     
                     # Métricas globales
                     writer.writerow([])
                     writer.writerow(['MÉTRICAS GLOBALES'])
-                    metrics = self.engine.get_metrics()
-                    for key, value in metrics.items():
-                        writer.writerow([key, value])
+                    writer.writerows(metrics.items())
                 
                 messagebox.showinfo("Éxito", f"Métricas exportadas a {filename}")
             except Exception as e:
@@ -1130,6 +1424,23 @@ class ProcessSimulatorGUI:
         text_widget = ctk.CTkTextbox(dialog)
         text_widget.pack(fill="both", expand=True, padx=10, pady=10)
         
+        text_widget.insert("1.0", self._build_summary())
+    
+    def _build_summary(self) -> str:
+        """Devuelve el resumen de métricas, reutilizándolo si el motor no cambió."""
+        with self.engine_lock:
+            engine = self.engine
+            key = (engine.version, engine.quantum)
+            cached = self._summary_cache
+            if cached is not None and cached[0] is engine and cached[1] == key:
+                return cached[2]
+            
+            summary = self._render_summary()
+            self._summary_cache = (engine, key, summary)
+            return summary
+    
+    def _render_summary(self) -> str:
+        """Construye el texto del resumen de métricas."""
         metrics = self.engine.get_metrics()
         
         summary = f"""📊 RESUMEN DE MÉTRICAS DEL SISTEMA
@@ -1158,18 +1469,12 @@ class ProcessSimulatorGUI:
 
 📈 Estados de Procesos:"""
         
-        # Contar procesos por estado
-        state_counts = {}
-        for process in self.engine.process_table.values():
-            if process.pid == 0:  # Skip init
-                continue
-            state = process.state
-            state_counts[state] = state_counts.get(state, 0) + 1
-        
-        for state, count in state_counts.items():
-            summary += f"\n   • {state}: {count}"
+        # Contar procesos por estado (excepto init)
+        state_counts = Counter(p.state for p in self.engine.live.values() if p.pid != 0)
+        if self.engine.archived:
+            state_counts[TERMINATED] = len(self.engine.archived)
         
-        text_widget.insert("1.0", summary)
+        return summary + "".join(f"{_SUMMARY_STATE_PREFIX[state]}{count}" for state, count in state_counts.items())
     
     def run(self):
         """Ejecuta la aplicación."""
@@ -1189,7 +1494,7 @@ def main():
     
     if args.demo:
         # Configurar demo
-        random.seed(42)
+        app.engine.set_seed(42)
         app.seed_var.set("42")
         app.auto_mode.set(True)
         app.auto_create_var.set(True)
@@ -1198,7 +1503,7 @@ def main():
         
         # Crear algunos procesos adicionales
         for i in range(3):
-            app.engine.create_process(f"Demo{i}", random.randint(8, 12))
+            app.engine.create_process(f"Demo{i}", app.engine.rng.randint(8, 12))
         
         # Iniciar automáticamente
         app.root.after(1000, app._start_auto)
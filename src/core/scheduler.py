@@ -2,58 +2,101 @@
 Scheduler con Prioridades para el simulador de procesos.
 """
 import random
-from collections import deque, defaultdict
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 from ..models.process import Process
 
 class PriorityScheduler:
     """Implementa el algoritmo de scheduling con Prioridades + Round-Robin por nivel."""
     
-    def __init__(self, quantum: int = 3):
+    def __init__(self, quantum: int = 3, rng: Optional[random.Random] = None):
         self.quantum = quantum
-        # Diccionario de colas por prioridad (0 = mayor prioridad)
-        self.priority_queues: Dict[int, deque] = defaultdict(deque)
+        self.rng = rng if rng is not None else random.Random()
+        self.max_priority_levels = 10  # 0-9, donde 0 es la más alta
+        # Una cola por nivel de prioridad, indexada por nivel (0 = mayor prioridad)
+        self.priority_queues: List[deque] = [deque() for _ in range(self.max_priority_levels)]
+        # Borrado perezoso: las colas pueden contener entradas obsoletas
+        self._pid_priority: Dict[int, int] = {}  # PID vigente en ready -> nivel
+        self._stale: Dict[Tuple[int, int], int] = {}  # (PID, nivel) -> entradas obsoletas
+        self.priority_counts: List[int] = [0] * self.max_priority_levels  # nivel -> PIDs vigentes
+        self._nonempty_mask = 0  # Bit p activo si el nivel p tiene PIDs vigentes
+        self._levels_version = 0  # Se incrementa con cada cambio de priority_counts
+        self._summary_cache: Optional[Tuple[int, str]] = None  # (versión, texto)
         self.current_running_pid: Optional[int] = None
         self.current_quantum_used = 0
         self.context_switches = 0
         
         # Configuración de prioridades
-        self.max_priority_levels = 10  # 0-9, donde 0 es la más alta
         self.priority_boost_interval = 20  # Cada cuántos ticks hacer boost de prioridad
         self.priority_boost_counter = 0
         
     def add_to_ready(self, pid: int, process_table: Dict[int, Process] = None):
         """Agrega un proceso a la cola de listos según su prioridad."""
-        if process_table and pid in process_table:
-            priority = process_table[pid].priority
+        process = process_table.get(pid) if process_table else None
+        if process is not None:
+            priority = process.priority
             # Asegurar que la prioridad esté en rango válido
             priority = max(0, min(priority, self.max_priority_levels - 1))
-            
-            if pid not in self.priority_queues[priority]:
-                self.priority_queues[priority].append(pid)
+            self._push(pid, priority)
         else:
             # Fallback: agregar a prioridad media si no hay tabla de procesos
-            if pid not in self.priority_queues[5]:
-                self.priority_queues[5].append(pid)
+            self._push(pid, 5)
+    
+    def _push(self, pid: int, priority: int):
+        """Encola un PID en su nivel si no está ya en ready."""
+        if pid in self._pid_priority:
+            return
+        self.priority_queues[priority].append(pid)
+        self._pid_priority[pid] = priority
+        self._resize_level(priority, 1)
+    
+    def _resize_level(self, priority: int, delta: int):
+        """Ajusta el tamaño vigente de un nivel y su bit en la máscara."""
+        size = self.priority_counts[priority] + delta
+        self.priority_counts[priority] = size
+        self._levels_version += 1
+        if size:
+            self._nonempty_mask |= 1 << priority
+        else:
+            self._nonempty_mask &= ~(1 << priority)
+    
+    def _consume_stale(self, pid: int, priority: int) -> bool:
+        """Descarta una entrada obsoleta de (pid, nivel); indica si lo era."""
+        key = (pid, priority)
+        stale = self._stale.get(key)
+        if not stale:
+            return False
+        if stale == 1:
+            del self._stale[key]
+        else:
+            self._stale[key] = stale - 1
+        return True
     
     def remove_from_ready(self, pid: int):
-        """Remueve un proceso de todas las colas de prioridad."""
-        for priority, queue in self.priority_queues.items():
-            if pid in queue:
-                temp_queue = deque()
-                while queue:
-                    current_pid = queue.popleft()
-                    if current_pid != pid:
-                        temp_queue.append(current_pid)
-                self.priority_queues[priority] = temp_queue
-                break
+        """Remueve un proceso de las colas de prioridad (borrado perezoso O(1))."""
+        priority = self._pid_priority.pop(pid, None)
+        if priority is None:
+            return
+        key = (pid, priority)
+        self._stale[key] = self._stale.get(key, 0) + 1
+        self._resize_level(priority, -1)
     
     def get_next_process(self) -> Optional[int]:
         """Obtiene el siguiente proceso a ejecutar (mayor prioridad primero)."""
-        # Buscar en orden de prioridad (0 = más alta)
-        for priority in sorted(self.priority_queues.keys()):
-            if self.priority_queues[priority]:
-                return self.priority_queues[priority].popleft()
+        if not self._nonempty_mask:
+            return None
+        
+        # Nivel no vacío de mayor prioridad (0 = más alta): bit activo más bajo
+        mask = self._nonempty_mask
+        priority = (mask & -mask).bit_length() - 1
+        queue = self.priority_queues[priority]
+        while queue:
+            pid = queue.popleft()
+            if self._consume_stale(pid, priority):
+                continue
+            del self._pid_priority[pid]
+            self._resize_level(priority, -1)
+            return pid
         return None
     
     def preempt_current(self, process_table: Dict[int, Process]) -> bool:
@@ -67,11 +110,10 @@ class PriorityScheduler:
             current_priority = current_process.priority
             
             # Buscar procesos de mayor prioridad en ready
-            for priority in range(0, current_priority):
-                if self.priority_queues[priority]:
-                    # Hay un proceso de mayor prioridad esperando
-                    self._preempt_process(current_process, process_table)
-                    return True
+            if self._nonempty_mask & ((1 << max(0, current_priority)) - 1):
+                # Hay un proceso de mayor prioridad esperando
+                self._preempt_process(current_process, process_table)
+                return True
         
         # Preempción por quantum agotado
         if self.current_quantum_used >= self.quantum:
@@ -92,8 +134,8 @@ class PriorityScheduler:
     
     def set_running(self, pid: int, process_table: Dict[int, Process]) -> bool:
         """Establece un proceso como el actual en ejecución."""
-        if pid in process_table:
-            process = process_table[pid]
+        process = process_table.get(pid)
+        if process is not None:
             process.state = 'RUNNING'
             self.current_running_pid = pid
             self.current_quantum_used = 0
@@ -117,35 +159,42 @@ class PriorityScheduler:
         if not process_table:
             return
             
+        rand = self.rng.random  # Referencia local: se llama una vez por PID
+        get_process = process_table.get
+        
         # Buscar procesos en colas de baja prioridad y moverlos a mayor prioridad
         for priority in range(self.max_priority_levels - 1, 0, -1):  # De menor a mayor prioridad
-            if self.priority_queues[priority]:
-                # Mover algunos procesos a prioridad más alta
-                queue = self.priority_queues[priority]
-                temp_queue = deque()
-                
-                while queue:
-                    pid = queue.popleft()
-                    if pid in process_table:
-                        process = process_table[pid]
-                        # Mover a prioridad más alta (decrementar número)
-                        if random.random() < 0.3:  # 30% de probabilidad
-                            new_priority = max(0, priority - 1)
-                            process.priority = new_priority
-                            self.priority_queues[new_priority].append(pid)
-                        else:
-                            temp_queue.append(pid)
-                    else:
-                        temp_queue.append(pid)
-                
-                self.priority_queues[priority] = temp_queue
+            queue = self.priority_queues[priority]
+            if not queue:
+                continue
+            
+            # Vaciar la cola de una vez en lugar de popleft/append por elemento
+            pids = list(queue)
+            queue.clear()
+            new_priority = priority - 1
+            promoted = self.priority_queues[new_priority]
+            
+            for pid in pids:
+                # Aprovechar la reconstrucción para purgar entradas obsoletas
+                if self._consume_stale(pid, priority):
+                    continue
+                process = get_process(pid)
+                # Mover a prioridad más alta (decrementar número), 30% de probabilidad
+                if process is not None and rand() < 0.3:
+                    process.priority = new_priority
+                    promoted.append(pid)
+                    self._pid_priority[pid] = new_priority
+                    self._resize_level(priority, -1)
+                    self._resize_level(new_priority, 1)
+                else:
+                    queue.append(pid)
     
     def adjust_priority(self, pid: int, new_priority: int, process_table: Dict[int, Process]):
         """Ajusta la prioridad de un proceso específico."""
-        if pid not in process_table:
+        process = process_table.get(pid)
+        if process is None:
             return False
-            
-        process = process_table[pid]
+        
         old_priority = process.priority
         new_priority = max(0, min(new_priority, self.max_priority_levels - 1))
         
@@ -161,11 +210,42 @@ class PriorityScheduler:
     
     def get_ready_queue_info(self) -> Dict[int, int]:
         """Obtiene información sobre las colas de prioridad."""
-        return {priority: len(queue) for priority, queue in self.priority_queues.items() if queue}
+        return {priority: count for priority, count in enumerate(self.priority_counts) if count}
+    
+    def get_ready_queue_summary(self) -> str:
+        """Texto "P0:3, P2:1" de las colas de prioridad (solo se recalcula si cambiaron)."""
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self._levels_version:
+            return cached[1]
+        summary = ", ".join(f"P{p}:{c}" for p, c in enumerate(self.priority_counts) if c) or "Vacía"
+        self._summary_cache = (self._levels_version, summary)
+        return summary
+    
+    def iter_ready(self, priority: int):
+        """Itera en orden los PIDs vigentes de un nivel de prioridad."""
+        # Las entradas obsoletas de un PID siempre preceden a su entrada vigente
+        if not 0 <= priority < self.max_priority_levels:
+            return
+        skip = {pid: count for (pid, level), count in self._stale.items() if level == priority}
+        for pid in self.priority_queues[priority]:
+            if skip.get(pid):
+                skip[pid] -= 1
+                continue
+            yield pid
+    
+    def get_ready_count(self) -> int:
+        """Número de procesos vigentes en las colas de listos."""
+        return len(self._pid_priority)
     
     def reset(self):
         """Reinicia el scheduler."""
-        self.priority_queues.clear()
+        for queue in self.priority_queues:
+            queue.clear()
+        self._pid_priority.clear()
+        self._stale.clear()
+        self.priority_counts[:] = [0] * self.max_priority_levels
+        self._nonempty_mask = 0
+        self._summary_cache = None
         self.current_running_pid = None
         self.current_quantum_used = 0
         self.context_switches = 0
@@ -175,12 +255,16 @@ class PriorityScheduler:
 class RoundRobinScheduler(PriorityScheduler):
     """Wrapper para mantener compatibilidad con código existente."""
     
-    def __init__(self, quantum: int = 3):
-        super().__init__(quantum)
+    def __init__(self, quantum: int = 3, rng: Optional[random.Random] = None):
+        super().__init__(quantum, rng)
         # En modo Round-Robin, todos los procesos tienen la misma prioridad
         self._round_robin_mode = True
     
+    @property
+    def ready_queue(self) -> List[int]:
+        """PIDs vigentes en la cola Round-Robin, en orden de ejecución."""
+        return list(self.iter_ready(5))
+    
     def add_to_ready(self, pid: int, process_table: Dict[int, Process] = None):
         """En modo RR, todos van a la misma cola."""
-        if pid not in self.priority_queues[5]:  # Prioridad media
-            self.priority_queues[5].append(pid)
+        self._push(pid, 5)  # Prioridad media
@@ -1,34 +1,66 @@
 """
 Motor principal de simulación de procesos.
 """
+import bisect
+import heapq
+import math
 import random
 from collections import deque
-from typing import Dict, List, Optional, Tuple
-from ..models.process import Process
+from typing import Dict, List, Optional, Set, Tuple
+from ..models.process import PROCESS_STATES, Process
 from .scheduler import PriorityScheduler
 
+# Estados desde los que se puede forzar un bloqueo
+_BLOCKABLE_STATES = frozenset({'READY', 'RUNNING'})
+
+# Plantillas % de los eventos del log (se formatean solo al consultar el log)
+_LOG_INIT_CREATED = "Proceso init (PID 0) creado con prioridad máxima"
+_LOG_CREATED = "Proceso %s (PID %d) creado con burst %d, prioridad %d"
+_LOG_NEW_READY = "Proceso %s (PID %d) NEW -> READY (prioridad %d)"
+_LOG_FORCED_BLOCK = "Proceso %s (PID %d) forzado a BLOCKED por %d ticks"
+_LOG_REAPED = "Proceso %s (PID %d) reapeado por padre %s"
+_LOG_ZOMBIE = "Proceso %s (PID %d) terminado -> ZOMBIE"
+_LOG_TERMINATED = "Proceso %s (PID %d) terminado -> TERMINATED"
+_LOG_UNBLOCKED = "Proceso %s (PID %d) desbloqueado -> READY (prioridad %d)"
+_LOG_RUNNING = "Proceso %s (PID %d) ejecutándose"
+_LOG_RANDOM_BLOCK = "Proceso %s (PID %d) bloqueado aleatoriamente por %d ticks"
+_LOG_PREEMPTED = "Proceso %s (PID %d) preemptado -> READY"
+_LOG_AUTO_REAPED = "Proceso %s (PID %d) auto-reapeado"
+
 class SimulatorEngine:
     """Motor de simulación que maneja la lógica de estados de procesos."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.tick = 0
         self.pid_counter = 1
         self.process_table: Dict[int, Process] = {}
-        self.scheduler = PriorityScheduler()
-        self.blocked_list = []
-        self.zombie_list = []
+        self.sorted_pids: List[int] = []  # PIDs de process_table en orden ascendente
+        self.rng = random.Random(seed)  # Compartido con el scheduler
+        self.scheduler = PriorityScheduler(rng=self.rng)
+        # Diccionarios ordenados (PID -> None): pertenencia y borrado O(1)
+        self.blocked_list: Dict[int, None] = {}
+        self.zombie_list: Dict[int, None] = {}
+        self._reap_heap: List[Tuple[int, int]] = []  # Montículo (end_tick, PID) de zombies; solo con auto-reap activo
         
         # Métricas
+        self.by_state: Dict[str, Set[int]] = {state: set() for state in PROCESS_STATES}  # Estado -> PIDs
         self.cpu_busy_ticks = 0
         self.idle_ticks = 0
+        self._turnaround_sum = 0
+        self._turnaround_count = 0
+        self._waiting_sum = 0
+        self._waiting_count = 0
         
         # Configuración
+        self._block_gap: Optional[int] = None  # Ticks de CPU sin bloqueo antes del próximo
         self.p_block = 0.1  # Probabilidad de bloqueo
+        self._create_gap: Optional[int] = None  # Ticks sin auto-crear antes de la próxima creación
         self.p_create = 0.05  # Probabilidad de auto-crear
         self.auto_reap_after = 10  # Ticks para auto-reap
         
         # Logs
-        self.event_logs = deque(maxlen=50)
+        self._event_log = deque(maxlen=50)  # (tick, plantilla %, argumentos); se formatea al consultarlo
+        self._metrics_cache: Optional[Dict] = None  # Última get_metrics(); None = hay que recalcular
         
         # Crear proceso init (PID 0)
         self._create_init_process()
@@ -45,20 +77,23 @@ class SimulatorEngine:
             created_tick=0
         )
         self.process_table[0] = init_process
-        self.log_event(f"Proceso init (PID 0) creado con prioridad máxima")
+        bisect.insort(self.sorted_pids, 0)
+        self.by_state['RUNNING'].add(0)
+        self.log_event(_LOG_INIT_CREATED)
     
     def create_process(self, name: str = None, burst: int = None, parent_pid: int = None, priority: int = None) -> int:
         """Crea un nuevo proceso en estado NEW."""
+        self._metrics_cache = None
         pid = self.pid_counter
         self.pid_counter += 1
         
         if name is None:
             name = f"P{pid}"
         if burst is None:
-            burst = random.randint(5, 15)
+            burst = self.rng.randint(5, 15)
         if priority is None:
             # Asignar prioridad aleatoria: 0-2 alta, 3-5 media, 6-8 baja, 9 muy baja
-            priority = random.randint(0, 8)
+            priority = self.rng.randint(0, 8)
         
         process = Process(
             pid=pid,
@@ -72,36 +107,42 @@ class SimulatorEngine:
         )
         
         self.process_table[pid] = process
+        bisect.insort(self.sorted_pids, pid)
+        self.by_state['NEW'].add(pid)
         
         # Agregar como hijo al padre
-        if parent_pid and parent_pid in self.process_table:
-            self.process_table[parent_pid].children.append(pid)
+        parent = self.process_table.get(parent_pid) if parent_pid else None
+        if parent is not None:
+            parent.children.append(pid)
+            parent.children_set.add(pid)
         
-        self.log_event(f"Proceso {name} (PID {pid}) creado con burst {burst}, prioridad {priority}")
+        self.log_event(_LOG_CREATED, name, pid, burst, priority)
         return pid
     
     def move_new_to_ready(self):
         """Mueve todos los procesos NEW a READY."""
-        moved_count = 0
-        for pid, process in self.process_table.items():
-            if process.state == 'NEW':
-                process.state = 'READY'
-                self.scheduler.add_to_ready(pid, self.process_table)
-                moved_count += 1
-                self.log_event(f"Proceso {process.name} (PID {pid}) NEW -> READY (prioridad {process.priority})")
-        return moved_count
+        self._metrics_cache = None
+        # Solo los PIDs en NEW (en orden de PID, como en process_table)
+        new_pids = sorted(self.by_state['NEW'])
+        for pid in new_pids:
+            process = self.process_table[pid]
+            self._set_state(process, 'READY')
+            self.scheduler.add_to_ready(pid, self.process_table)
+            self.log_event(_LOG_NEW_READY, process.name, pid, process.priority)
+        return len(new_pids)
     
     def force_block_process(self, pid: int, io_time: int = None) -> bool:
         """Fuerza el bloqueo de un proceso."""
-        if pid not in self.process_table or pid == 0:  # No bloquear init
+        self._metrics_cache = None
+        process = self.process_table.get(pid)
+        if process is None or pid == 0:  # No bloquear init
             return False
         
-        process = self.process_table[pid]
-        if process.state not in ['READY', 'RUNNING']:
+        if process.state not in _BLOCKABLE_STATES:
             return False
         
         if io_time is None:
-            io_time = random.randint(3, 8)
+            io_time = self.rng.randint(3, 8)
         
         # Liberar CPU si estaba corriendo
         if self.scheduler.current_running_pid == pid:
@@ -112,20 +153,21 @@ class SimulatorEngine:
         self.scheduler.remove_from_ready(pid)
         
         # Marcar como bloqueado
-        process.state = 'BLOCKED'
+        self._set_state(process, 'BLOCKED')
         process.io_remaining = io_time
         process.blocked_count += 1
-        self.blocked_list.append(pid)
+        self.blocked_list[pid] = None
         
-        self.log_event(f"Proceso {process.name} (PID {pid}) forzado a BLOCKED por {io_time} ticks")
+        self.log_event(_LOG_FORCED_BLOCK, process.name, pid, io_time)
         return True
     
     def force_terminate_process(self, pid: int) -> bool:
         """Fuerza la terminación de un proceso."""
-        if pid not in self.process_table or pid == 0:  # No terminar init
+        self._metrics_cache = None
+        process = self.process_table.get(pid)
+        if process is None or pid == 0:  # No terminar init
             return False
         
-        process = self.process_table[pid]
         if process.state == 'TERMINATED':
             return False
         
@@ -139,57 +181,95 @@ class SimulatorEngine:
         
         # Marcar como terminado
         process.remaining_burst = 0
-        process.end_tick = self.tick
-        
-        # Verificar si debe ser zombie
-        if process.parent_pid and process.parent_pid in self.process_table:
-            parent = self.process_table[process.parent_pid]
-            if not parent.waiting_for_child:
-                process.state = 'ZOMBIE'
-                self.zombie_list.append(pid)
-                self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> ZOMBIE")
-            else:
-                process.state = 'TERMINATED'
-                process.reaped = True
-                self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
-        else:
-            process.state = 'TERMINATED'
-            self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
+        self._finalize_process(process)
         
         return True
     
     def wait_for_child(self, parent_pid: int) -> List[int]:
         """Implementa la llamada wait() para reapear procesos zombie."""
-        if parent_pid not in self.process_table:
+        self._metrics_cache = None
+        parent = self.process_table.get(parent_pid)
+        if parent is None:
             return []
         
-        parent = self.process_table[parent_pid]
         reaped_children = []
         
-        # Buscar hijos zombie
-        for child_pid in parent.children[:]:  # Copia para modificar durante iteración
-            if child_pid in self.process_table:
-                child = self.process_table[child_pid]
-                if child.state == 'ZOMBIE':
-                    child.state = 'TERMINATED'
-                    child.reaped = True
-                    if child_pid in self.zombie_list:
-                        self.zombie_list.remove(child_pid)
-                    reaped_children.append(child_pid)
-                    self.log_event(f"Proceso {child.name} (PID {child_pid}) reapeado por padre {parent.name}")
+        # Solo los hijos que están en zombie_list (intersección de conjuntos en C)
+        for child_pid in sorted(parent.children_set & self.zombie_list.keys()):
+            child = self.process_table.get(child_pid)
+            if child is not None and child.state == 'ZOMBIE':
+                self._set_state(child, 'TERMINATED')
+                child.reaped = True
+                self.zombie_list.pop(child_pid, None)
+                reaped_children.append(child_pid)
+                self.log_event(_LOG_REAPED, child.name, child_pid, parent.name)
         
         return reaped_children
     
+    def _set_state(self, process: Process, new_state: str):
+        """Cambia el estado de un proceso manteniendo los contadores por estado."""
+        self._index_transition(process.pid, process.state, new_state)
+        process.state = new_state
+    
+    def _index_transition(self, pid: int, old_state: str, new_state: str):
+        """Actualiza by_state (también para transiciones hechas por el scheduler)."""
+        self.by_state[old_state].discard(pid)
+        self.by_state[new_state].add(pid)
+    
+    @property
+    def state_counts(self) -> Dict[str, int]:
+        """Número de procesos en cada estado."""
+        return {state: len(pids) for state, pids in self.by_state.items()}
+    
+    def _set_end_tick(self, process: Process):
+        """Fija el tick de fin y actualiza las sumas de turnaround y espera."""
+        self._account_finished(process, -1)  # Un zombie forzado a terminar ya estaba contabilizado
+        process.end_tick = self.tick
+        process.turnaround = process.end_tick - process.created_tick
+        process.waiting = process.turnaround - process.total_burst if process.start_tick is not None else None
+        self._account_finished(process, 1)
+    
+    def _account_finished(self, process: Process, sign: int):
+        """Suma (o resta) la contribución de un proceso terminado a las métricas."""
+        if process.end_tick is None or process.pid == 0:
+            return
+        turnaround = process.end_tick - process.created_tick
+        self._turnaround_sum += sign * turnaround
+        self._turnaround_count += sign
+        if process.start_tick is not None:
+            self._waiting_sum += sign * (turnaround - process.total_burst)
+            self._waiting_count += sign
+    
+    def _finalize_process(self, process: Process):
+        """Cierra un proceso que terminó: ZOMBIE si su padre no lo espera, si no TERMINATED."""
+        self._set_end_tick(process)
+        parent = self.process_table.get(process.parent_pid) if process.parent_pid else None
+        if parent is not None and not parent.waiting_for_child:
+            self._make_zombie(process)
+            self.log_event(_LOG_ZOMBIE, process.name, process.pid)
+            return
+        
+        self._set_state(process, 'TERMINATED')
+        if parent is not None:
+            process.reaped = True
+        self.log_event(_LOG_TERMINATED, process.name, process.pid)
+    
+    def _make_zombie(self, process: Process):
+        """Pasa un proceso a ZOMBIE y lo programa para el auto-reap."""
+        self._set_state(process, 'ZOMBIE')
+        self.zombie_list[process.pid] = None
+        if self.auto_reap_after > 0:
+            heapq.heappush(self._reap_heap, (process.end_tick, process.pid))
+    
     def _remove_from_queues(self, pid: int):
         """Remueve un proceso de todas las colas."""
         self.scheduler.remove_from_ready(pid)
-        if pid in self.blocked_list:
-            self.blocked_list.remove(pid)
-        if pid in self.zombie_list:
-            self.zombie_list.remove(pid)
+        self.blocked_list.pop(pid, None)
+        self.zombie_list.pop(pid, None)
     
     def tick_simulation(self):
         """Ejecuta un tick de simulación."""
+        self._metrics_cache = None
         self.tick += 1
         
         # 1. Gestionar procesos bloqueados
@@ -205,35 +285,82 @@ class SimulatorEngine:
         if self.auto_reap_after > 0:
             self._auto_reap_zombies()
     
+    def advance(self, ticks: int = 1, auto_create: bool = False):
+        """Avanza varios ticks (modo por lotes); con auto_create crea procesos con probabilidad p_create por tick."""
+        self._metrics_cache = None
+        while ticks > 0:
+            if auto_create and self._should_auto_create():
+                self.create_process()
+            elif self._is_idle():
+                # Nada que ejecutar ni esperar: los ticks ociosos hasta la próxima creación se saltan de una vez
+                skip = ticks
+                if auto_create and self._create_gap is not None:
+                    skip = min(ticks, self._create_gap + 1)
+                    self._create_gap -= skip - 1
+                self.tick += skip
+                self.idle_ticks += skip
+                ticks -= skip
+                continue
+            self.tick_simulation()
+            ticks -= 1
+    
+    def _is_idle(self) -> bool:
+        """Indica si un tick no haría más que contar como CPU ociosa."""
+        return (self.scheduler.current_running_pid is None
+                and not self.scheduler.get_ready_count()
+                and not self.blocked_list
+                and not self.by_state['NEW']
+                and not (self.zombie_list and self.auto_reap_after > 0))
+    
+    def _should_auto_create(self) -> bool:
+        """Sorteo Bernoulli(p_create) del tick actual mediante saltos geométricos."""
+        if self.p_create <= 0:
+            return False
+        if self._create_gap is None:
+            # Número de ticks sin creación antes de la siguiente: un solo sorteo por creación
+            if self.p_create >= 1:
+                self._create_gap = 0
+            else:
+                self._create_gap = int(math.log(1.0 - self.rng.random()) / math.log(1.0 - self.p_create))
+        if self._create_gap == 0:
+            self._create_gap = None
+            return True
+        self._create_gap -= 1
+        return False
+    
     def _handle_blocked_processes(self):
         """Maneja los procesos bloqueados."""
-        unblocked = []
-        for pid in self.blocked_list[:]:  # Copia para modificar durante iteración
-            if pid in self.process_table:
-                process = self.process_table[pid]
-                if process.io_remaining > 0:
-                    process.io_remaining -= 1
-                if process.io_remaining == 0:
-                    process.state = 'READY'
-                    self.scheduler.add_to_ready(pid, self.process_table)
-                    unblocked.append(pid)
-                    self.log_event(f"Proceso {process.name} (PID {pid}) desbloqueado -> READY (prioridad {process.priority})")        # Remover de blocked_list
-        for pid in unblocked:
-            self.blocked_list.remove(pid)
+        # Una sola pasada: los que siguen bloqueados forman la nueva lista
+        get_process = self.process_table.get
+        still_blocked: Dict[int, None] = {}
+        for pid in self.blocked_list:
+            process = get_process(pid)
+            if process is None:
+                continue
+            if process.io_remaining > 0:
+                process.io_remaining -= 1
+            if process.io_remaining == 0:
+                self._set_state(process, 'READY')
+                self.scheduler.add_to_ready(pid, self.process_table)
+                self.log_event(_LOG_UNBLOCKED, process.name, pid, process.priority)
+            else:
+                still_blocked[pid] = None
+        self.blocked_list = still_blocked
     
     def _schedule_processes(self):
         """Implementa el scheduler Round-Robin."""
         # Si no hay proceso corriendo y hay procesos en ready
         if self.scheduler.current_running_pid is None:
             next_pid = self.scheduler.get_next_process()
-            if next_pid and next_pid in self.process_table:
-                process = self.process_table[next_pid]
+            process = self.process_table.get(next_pid) if next_pid else None
+            if process is not None:
                 self.scheduler.set_running(next_pid, self.process_table)
+                self._index_transition(next_pid, 'READY', 'RUNNING')
                 
                 if process.start_tick is None:
                     process.start_tick = self.tick
                 
-                self.log_event(f"Proceso {process.name} (PID {next_pid}) ejecutándose")
+                self.log_event(_LOG_RUNNING, process.name, next_pid)
         
         # Ejecutar proceso actual
         if self.scheduler.current_running_pid is not None:
@@ -244,11 +371,11 @@ class SimulatorEngine:
     def _execute_current_process(self):
         """Ejecuta el proceso actual por un sub-tick."""
         pid = self.scheduler.current_running_pid
-        if pid not in self.process_table:
+        process = self.process_table.get(pid)
+        if process is None:
             self.scheduler.current_running_pid = None
             return
         
-        process = self.process_table[pid]
         self.cpu_busy_ticks += 1
         self.scheduler.tick(self.process_table)  # Pasar process_table
         
@@ -257,92 +384,101 @@ class SimulatorEngine:
         
         # Verificar si el proceso termina
         if process.remaining_burst <= 0:
-            process.end_tick = self.tick
             self.scheduler.current_running_pid = None
             self.scheduler.current_quantum_used = 0
-            
-            # Verificar si debe ser zombie
-            if process.parent_pid and process.parent_pid in self.process_table:
-                parent = self.process_table[process.parent_pid]
-                if not parent.waiting_for_child:
-                    process.state = 'ZOMBIE'
-                    self.zombie_list.append(pid)
-                    self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> ZOMBIE")
-                else:
-                    process.state = 'TERMINATED'
-                    process.reaped = True
-                    self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
-            else:
-                process.state = 'TERMINATED'
-                self.log_event(f"Proceso {process.name} (PID {pid}) terminado -> TERMINATED")
+            self._finalize_process(process)
             return
         
         # Verificar bloqueo aleatorio
-        if random.random() < self.p_block:
-            io_time = random.randint(2, 5)
-            process.state = 'BLOCKED'
+        if self._should_block():
+            io_time = self.rng.randint(2, 5)
+            self._set_state(process, 'BLOCKED')
             process.io_remaining = io_time
             process.blocked_count += 1
-            self.blocked_list.append(pid)
+            self.blocked_list[pid] = None
             self.scheduler.current_running_pid = None
             self.scheduler.current_quantum_used = 0
-            self.log_event(f"Proceso {process.name} (PID {pid}) bloqueado aleatoriamente por {io_time} ticks")
+            self.log_event(_LOG_RANDOM_BLOCK, process.name, pid, io_time)
             return
         
         # Verificar preempción por quantum
         self.scheduler.preempt_current(self.process_table)
         if self.scheduler.current_running_pid != pid:  # Fue preemptado
-            self.log_event(f"Proceso {process.name} (PID {pid}) preemptado -> READY")
+            self._index_transition(pid, 'RUNNING', 'READY')
+            self.log_event(_LOG_PREEMPTED, process.name, pid)
+    
+    def _should_block(self) -> bool:
+        """Sorteo Bernoulli(p_block) del tick actual mediante saltos geométricos."""
+        if self.p_block <= 0:
+            return False
+        if self._block_gap is None:
+            # Número de ticks sin bloqueo antes del siguiente: un solo sorteo por bloqueo
+            if self.p_block >= 1:
+                self._block_gap = 0
+            else:
+                self._block_gap = int(math.log(1.0 - self.rng.random()) / math.log(1.0 - self.p_block))
+        if self._block_gap == 0:
+            self._block_gap = None
+            return True
+        self._block_gap -= 1
+        return False
     
     def _auto_reap_zombies(self):
         """Auto-reapea zombies después de cierto tiempo."""
-        for pid in self.zombie_list[:]:  # Copia para modificar durante iteración
-            if pid in self.process_table:
-                process = self.process_table[pid]
-                zombie_age = self.tick - (process.end_tick or 0)
-                if zombie_age >= self.auto_reap_after:
-                    process.state = 'TERMINATED'
-                    process.reaped = True
-                    self.zombie_list.remove(pid)
-                    self.log_event(f"Proceso {process.name} (PID {pid}) auto-reapeado")
-    
-    def log_event(self, message: str):
-        """Registra un evento en el log."""
-        timestamp = f"[T{self.tick:03d}]"
-        self.event_logs.append(f"{timestamp} {message}")
+        # Solo se visitan los zombies vencidos: los más antiguos están en la cima del montículo
+        heap = self._reap_heap
+        deadline = self.tick - self.auto_reap_after
+        while heap and heap[0][0] <= deadline:
+            end_tick, pid = heapq.heappop(heap)
+            process = self.process_table.get(pid)
+            # Entradas obsoletas: zombie ya reapeado o terminado de nuevo con otro end_tick
+            if process is None or pid not in self.zombie_list or process.end_tick != end_tick:
+                continue
+            self._set_state(process, 'TERMINATED')
+            process.reaped = True
+            del self.zombie_list[pid]
+            self.log_event(_LOG_AUTO_REAPED, process.name, pid)
+    
+    def log_event(self, message: str, *args):
+        """Registra un evento en el log (el texto se formatea al consultarlo)."""
+        self._event_log.append((self.tick, message, args))
+    
+    def get_logs(self) -> List[str]:
+        """Devuelve los eventos registrados ya formateados."""
+        return [
+            f"[T{tick:03d}] {message % args if args else message}"
+            for tick, message, args in self._event_log
+        ]
+    
+    @property
+    def event_logs(self) -> List[str]:
+        """Vista formateada del log ("[Tnnn] mensaje"), como la consumen el exportador y la GUI."""
+        return self.get_logs()
     
     def get_metrics(self) -> Dict:
-        """Obtiene las métricas del sistema."""
+        """Obtiene las métricas del sistema (en caché mientras el estado no cambie)."""
+        if self._metrics_cache is not None:
+            return self._metrics_cache
+        
         total_processes = len(self.process_table)
-        running_processes = sum(1 for p in self.process_table.values() if p.state == 'RUNNING')
-        ready_processes = sum(len(queue) for queue in self.scheduler.priority_queues.values())
+        running_processes = len(self.by_state['RUNNING'])
+        ready_processes = self.scheduler.get_ready_count()
         blocked_processes = len(self.blocked_list)
         zombie_processes = len(self.zombie_list)
-        terminated_processes = sum(1 for p in self.process_table.values() if p.state == 'TERMINATED')
+        terminated_processes = len(self.by_state['TERMINATED'])
         
-        # Información de colas de prioridad
-        priority_queues_info = self.scheduler.get_ready_queue_info()
-        priority_info = ", ".join([f"P{p}:{c}" for p, c in sorted(priority_queues_info.items()) if c > 0])
-        if not priority_info:
-            priority_info = "Vacía"
+        # Información de colas de prioridad (texto en caché del scheduler)
+        priority_info = self.scheduler.get_ready_queue_summary()
         
         # Calcular CPU utilization
         total_ticks = max(1, self.tick)
         cpu_utilization = (self.cpu_busy_ticks / total_ticks) * 100
         
-        # Calcular turnaround promedio
-        finished_processes = [p for p in self.process_table.values() if p.is_finished() and p.pid != 0]
-        if finished_processes:
-            turnaround_times = [p.get_turnaround_time() for p in finished_processes if p.get_turnaround_time() is not None]
-            avg_turnaround = sum(turnaround_times) / len(turnaround_times) if turnaround_times else 0
-            
-            waiting_times = [p.get_waiting_time() for p in finished_processes if p.get_waiting_time() is not None]
-            avg_waiting = sum(waiting_times) / len(waiting_times) if waiting_times else 0
-        else:
-            avg_turnaround = 0
-            avg_waiting = 0
+        # Promedios a partir de las sumas mantenidas al terminar cada proceso
+        avg_turnaround = self._turnaround_sum / self._turnaround_count if self._turnaround_count else 0
+        avg_waiting = self._waiting_sum / self._waiting_count if self._waiting_count else 0
         
-        return {
+        self._metrics_cache = {
             'tick': self.tick,
             'total_processes': total_processes,
             'running': running_processes,
@@ -356,44 +492,90 @@ class SimulatorEngine:
             'avg_turnaround': avg_turnaround,
             'avg_waiting': avg_waiting
         }
+        return self._metrics_cache
     
     def reset(self):
         """Reinicia el simulador."""
         self.tick = 0
         self.pid_counter = 1
         self.process_table.clear()
+        self.sorted_pids.clear()
+        self.by_state = {state: set() for state in PROCESS_STATES}
         self.scheduler.reset()
         self.blocked_list.clear()
         self.zombie_list.clear()
+        self._reap_heap.clear()
         self.cpu_busy_ticks = 0
         self.idle_ticks = 0
-        self.event_logs.clear()
+        self._turnaround_sum = 0
+        self._turnaround_count = 0
+        self._waiting_sum = 0
+        self._waiting_count = 0
+        self._block_gap = None
+        self._create_gap = None
+        self._event_log.clear()
+        self._metrics_cache = None
         self._create_init_process()
     
+    def set_seed(self, seed: Optional[int]):
+        """Reinicia el generador aleatorio del motor y del scheduler."""
+        self.rng.seed(seed)
+    
+    def adjust_priority(self, pid: int, new_priority: int) -> bool:
+        """Cambia la prioridad de un proceso (delegando en el scheduler)."""
+        self._metrics_cache = None
+        return self.scheduler.adjust_priority(pid, new_priority, self.process_table)
+    
+    @property
+    def p_block(self) -> float:
+        """Probabilidad de bloqueo por tick de CPU."""
+        return self._p_block
+    
+    @p_block.setter
+    def p_block(self, probability: float):
+        # El salto ya sorteado corresponde a la probabilidad anterior
+        self._p_block = probability
+        self._block_gap = None
+    
+    @property
+    def p_create(self) -> float:
+        """Probabilidad de auto-crear un proceso en cada tick."""
+        return self._p_create
+    
+    @p_create.setter
+    def p_create(self, probability: float):
+        self._p_create = probability
+        self._create_gap = None
+    
+    @property
+    def auto_reap_after(self) -> int:
+        """Ticks que un zombie espera antes del auto-reap (0 = desactivado)."""
+        return self._auto_reap_after
+    
+    @auto_reap_after.setter
+    def auto_reap_after(self, ticks: int):
+        self._auto_reap_after = ticks
+        # Sin auto-reap nadie vacía el montículo: se descarta y se reconstruye con los zombies vivos al activarlo
+        if ticks > 0:
+            self._reap_heap = [(self.process_table[pid].end_tick, pid) for pid in self.zombie_list]
+            heapq.heapify(self._reap_heap)
+        else:
+            self._reap_heap.clear()
+    
     def set_quantum(self, quantum: int):
         """Establece el quantum del scheduler."""
         self.scheduler.quantum = max(1, quantum)
     
     def get_process_tree(self) -> Dict:
         """Obtiene el árbol de procesos."""
+        # Dos pasadas lineales sin recursión: crear todos los nodos y luego enlazarlos
+        nodes = {pid: {'process': process, 'children': {}} for pid, process in self.process_table.items()}
         tree = {}
-        for pid, process in self.process_table.items():
-            if process.parent_pid is None or process.parent_pid not in self.process_table:
-                tree[pid] = self._build_subtree(pid)
+        for pid, node in nodes.items():
+            process = node['process']
+            children = node['children']
+            for child_pid in process.children:
+                children[child_pid] = nodes.get(child_pid, {})
+            if process.parent_pid is None or process.parent_pid not in nodes:
+                tree[pid] = node
         return tree
-    
-    def _build_subtree(self, pid: int) -> Dict:
-        """Construye un subárbol de procesos."""
-        if pid not in self.process_table:
-            return {}
-        
-        process = self.process_table[pid]
-        subtree = {
-            'process': process,
-            'children': {}
-        }
-        
-        for child_pid in process.children:
-            subtree['children'][child_pid] = self._build_subtree(child_pid)
-        
-        return subtree
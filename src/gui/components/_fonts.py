@@ -0,0 +1,13 @@
+"""
+Registro compartido de fuentes para los componentes de la interfaz.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=None)
+def ctk_font(size: int, weight: Optional[str] = None) -> ctk.CTkFont:
+    """Devuelve una CTkFont única por (tamaño, peso); se crea en el primer uso."""
+    return ctk.CTkFont(size=size, weight=weight)
@@ -3,36 +3,56 @@ Panel de acciones para interactuar con procesos.
 """
 import customtkinter as ctk
 from typing import Callable, Optional
+from ._fonts import ctk_font
 
 class ActionPanel(ctk.CTkFrame):
     """Panel de acciones para manipular procesos."""
     
-    def __init__(self, parent, **kwargs):
+    def __init__(
+        self,
+        parent,
+        *,
+        on_create_process: Optional[Callable] = None,
+        on_create_child: Optional[Callable] = None,
+        on_change_priority: Optional[Callable] = None,
+        on_new_to_ready: Optional[Callable] = None,
+        on_force_block: Optional[Callable] = None,
+        on_force_terminate: Optional[Callable] = None,
+        on_wait_reap: Optional[Callable] = None,
+        on_show_tree: Optional[Callable] = None,
+        tick_command: Optional[Callable] = None,
+        **kwargs
+    ):
         super().__init__(parent, **kwargs)
         
-        # Callbacks
-        self.create_process_callback: Optional[Callable] = None
-        self.create_child_callback: Optional[Callable] = None
-        self.change_priority_callback: Optional[Callable] = None
-        self.new_to_ready_callback: Optional[Callable] = None
-        self.force_block_callback: Optional[Callable] = None
-        self.force_terminate_callback: Optional[Callable] = None
-        self.wait_reap_callback: Optional[Callable] = None
-        self.show_tree_callback: Optional[Callable] = None
-        self.tick_manual_callback: Optional[Callable] = None
+        # Comandos de los botones, fijados una sola vez al construir.
+        # Los que no dependen de la selección se enlazan directamente al botón.
+        self._create_process_command = on_create_process
+        self._new_to_ready_command = on_new_to_ready
+        self._show_tree_command = on_show_tree
+        self._tick_command = tick_command  # Despachador de tick compartido (ControlPanel)
+        self._create_child_command = self._with_selection(on_create_child)
+        self._change_priority_command = self._with_selection(on_change_priority)
+        self._force_block_command = self._with_selection(on_force_block)
+        self._force_terminate_command = self._with_selection(on_force_terminate)
+        self._wait_reap_command = self._with_selection(on_wait_reap)
         
         # Estado
         self.selected_pid: Optional[int] = None
+        self._last_name: Optional[str] = None  # Nombre mostrado para selected_pid
+        self._buttons_enabled = False  # Estado actual de los botones que requieren selección
         
         self._setup_ui()
     
     def _setup_ui(self):
         """Configura la interfaz de usuario."""
+        button_font = ctk_font(9)  # Compartida por todos los botones
+        
         # Título - más compacto
         title_label = ctk.CTkLabel(
             self, 
             text="⚙️ Acciones", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=ctk_font(14, "bold")
         )
         title_label.pack(pady=(8, 8))
         
@@ -40,7 +60,7 @@ class ActionPanel(ctk.CTkFrame):
         self.selection_label = ctk.CTkLabel(
             self,
             text="Selecciona un proceso",
-            font=ctk.CTkFont(size=10),
+            font=ctk_font(10),
             text_color="gray"
         )
         self.selection_label.pack(pady=(0, 8))
@@ -56,20 +76,20 @@ class ActionPanel(ctk.CTkFrame):
         self.create_button = ctk.CTkButton(
             create_frame,
             text="➕ Crear Proceso",
-            command=self._on_create_process,
+            command=self._create_process_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9)
+            font=button_font
         )
         self.create_button.pack(pady=1)
         
         self.create_child_button = ctk.CTkButton(
             create_frame,
             text="👶 Crear Hijo",
-            command=self._on_create_child,
+            command=self._create_child_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9),
+            font=button_font,
             state="disabled"
         )
         self.create_child_button.pack(pady=1)
@@ -77,10 +97,10 @@ class ActionPanel(ctk.CTkFrame):
         self.priority_button = ctk.CTkButton(
             create_frame,
             text="🎯 Cambiar Prioridad",
-            command=self._on_change_priority,
+            command=self._change_priority_command,
             width=115,
             height=26,
-            font=ctk.CTkFont(size=9),
+            font=button_font,
             state="disabled"
         )
         self.priority_button.pack(pady=1)
@@ -96,10 +116,10 @@ class ActionPanel(ctk.CTkFrame):
         self.new_to_ready_button = ctk.CTkButton(
             transition_frame,
             text="🔄 NEW → READY",
-            command=self._on_new_to_ready,
+            command=self._new_to_ready_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9)
+            font=button_font
         )
         self.new_to_ready_button.pack(pady=1)
         
@@ -110,10 +130,10 @@ class ActionPanel(ctk.CTkFrame):
         self.force_block_button = ctk.CTkButton(
             force_frame,
             text="⏸ Forzar Bloqueo",
-            command=self._on_force_block,
+            command=self._force_block_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9),
+            font=button_font,
             state="disabled"
         )
         self.force_block_button.pack(pady=1)
@@ -121,10 +141,10 @@ class ActionPanel(ctk.CTkFrame):
         self.force_terminate_button = ctk.CTkButton(
             force_frame,
             text="❌ Forzar Terminar",
-            command=self._on_force_terminate,
+            command=self._force_terminate_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9),
+            font=button_font,
             state="disabled"
         )
         self.force_terminate_button.pack(pady=1)
@@ -140,10 +160,10 @@ class ActionPanel(ctk.CTkFrame):
         self.wait_button = ctk.CTkButton(
             management_frame,
             text="⏳ Wait (Reap)",
-            command=self._on_wait_reap,
+            command=self._wait_reap_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9),
+            font=button_font,
             state="disabled"
         )
         self.wait_button.pack(pady=1)
@@ -151,121 +171,61 @@ class ActionPanel(ctk.CTkFrame):
         self.tree_button = ctk.CTkButton(
             management_frame,
             text="🌳 Ver Árbol",
-            command=self._on_show_tree,
+            command=self._show_tree_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9)
+            font=button_font
         )
         self.tree_button.pack(pady=1)
         
         self.tick_button = ctk.CTkButton(
             management_frame,
             text="⚡ Tick Manual",
-            command=self._on_tick_manual,
+            command=self._tick_command,
             width=115,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9)
+            font=button_font
         )
         self.tick_button.pack(pady=1)
+        
+        # Botones que requieren un proceso seleccionado
+        self._selection_buttons = (
+            self.create_child_button,
+            self.priority_button,
+            self.force_block_button,
+            self.force_terminate_button,
+            self.wait_button,
+        )
     
     def update_selection(self, pid: Optional[int], process_name: str = None):
         """Actualiza la selección actual."""
+        # Selección idéntica a la mostrada: nada que redibujar
+        if pid == self.selected_pid and process_name == self._last_name:
+            return
         self.selected_pid = pid
+        self._last_name = process_name
         
         if pid is not None:
             self.selection_label.configure(
                 text=f"Seleccionado: PID {pid}" + (f" ({process_name})" if process_name else ""),
                 text_color="white"
             )
-            
-            # Habilitar botones que requieren selección
-            self.create_child_button.configure(state="normal")
-            self.priority_button.configure(state="normal")
-            self.force_block_button.configure(state="normal")
-            self.force_terminate_button.configure(state="normal")
-            self.wait_button.configure(state="normal")
         else:
             self.selection_label.configure(
                 text="Selecciona un proceso",
                 text_color="gray"
             )
-            
-            # Deshabilitar botones que requieren selección
-            self.create_child_button.configure(state="disabled")
-            self.priority_button.configure(state="disabled")
-            self.force_block_button.configure(state="disabled")
-            self.force_terminate_button.configure(state="disabled")
-            self.wait_button.configure(state="disabled")
-    
-    def _on_create_process(self):
-        """Maneja la creación de un nuevo proceso."""
-        if self.create_process_callback:
-            self.create_process_callback()
-    
-    def _on_create_child(self):
-        """Maneja la creación de un proceso hijo."""
-        if self.create_child_callback and self.selected_pid is not None:
-            self.create_child_callback(self.selected_pid)
-    
-    def _on_change_priority(self):
-        """Maneja el cambio de prioridad de un proceso."""
-        if self.change_priority_callback and self.selected_pid is not None:
-            self.change_priority_callback(self.selected_pid)
-    
-    def _on_new_to_ready(self):
-        """Maneja la transición NEW → READY."""
-        if self.new_to_ready_callback:
-            self.new_to_ready_callback()
-    
-    def _on_force_block(self):
-        """Maneja el forzado de bloqueo."""
-        if self.force_block_callback and self.selected_pid is not None:
-            self.force_block_callback(self.selected_pid)
-    
-    def _on_force_terminate(self):
-        """Maneja el forzado de terminación."""
-        if self.force_terminate_callback and self.selected_pid is not None:
-            self.force_terminate_callback(self.selected_pid)
-    
-    def _on_wait_reap(self):
-        """Maneja la operación wait/reap."""
-        if self.wait_reap_callback and self.selected_pid is not None:
-            self.wait_reap_callback(self.selected_pid)
-    
-    def _on_show_tree(self):
-        """Maneja la visualización del árbol."""
-        if self.show_tree_callback:
-            self.show_tree_callback()
-    
-    def _on_tick_manual(self):
-        """Maneja el tick manual."""
-        if self.tick_manual_callback:
-            self.tick_manual_callback()
-    
-    # Métodos para establecer callbacks
-    def set_create_process_callback(self, callback: Callable):
-        self.create_process_callback = callback
-    
-    def set_create_child_callback(self, callback: Callable):
-        self.create_child_callback = callback
-    
-    def set_change_priority_callback(self, callback: Callable):
-        self.change_priority_callback = callback
-    
-    def set_new_to_ready_callback(self, callback: Callable):
-        self.new_to_ready_callback = callback
-    
-    def set_force_block_callback(self, callback: Callable):
-        self.force_block_callback = callback
-    
-    def set_force_terminate_callback(self, callback: Callable):
-        self.force_terminate_callback = callback
-    
-    def set_wait_reap_callback(self, callback: Callable):
-        self.wait_reap_callback = callback
-    
-    def set_show_tree_callback(self, callback: Callable):
-        self.show_tree_callback = callback
-    
-    def set_tick_manual_callback(self, callback: Callable):
-        self.tick_manual_callback = callback
+        
+        # Habilitar/deshabilitar los botones solo cuando su estado cambia
+        want = pid is not None
+        if want != self._buttons_enabled:
+            state = "normal" if want else "disabled"
+            for button in self._selection_buttons:
+                button.configure(state=state)
+            self._buttons_enabled = want
+    
+    def _with_selection(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """Envuelve un callback que recibe el PID seleccionado (si hay uno)."""
+        if callback is None:
+            return None
+        return lambda: callback(self.selected_pid) if self.selected_pid is not None else None
@@ -3,6 +3,7 @@ Panel de control principal de la interfaz gráfica.
 """
 import customtkinter as ctk
 from typing import Callable, Optional
+from ._fonts import ctk_font
 
 class ControlPanel(ctk.CTkFrame):
     """Panel de control con botones principales."""
@@ -14,7 +15,6 @@ class ControlPanel(ctk.CTkFrame):
         self.start_auto_callback: Optional[Callable] = None
         self.pause_callback: Optional[Callable] = None
         self.reset_callback: Optional[Callable] = None
-        self.tick_manual_callback: Optional[Callable] = None
         self.quantum_change_callback: Optional[Callable] = None
         self.speed_change_callback: Optional[Callable] = None
         self.auto_create_callback: Optional[Callable] = None
@@ -23,8 +23,6 @@ class ControlPanel(ctk.CTkFrame):
         # Variables
         self.is_auto_mode = ctk.BooleanVar(value=False)
         self.auto_create_enabled = ctk.BooleanVar(value=False)
-        self.quantum_var = ctk.IntVar(value=3)
-        self.speed_var = ctk.DoubleVar(value=1.0)
         self.seed_var = ctk.StringVar(value="42")
         
         self._setup_ui()
@@ -35,7 +33,7 @@ class ControlPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self, 
             text="🎮 Simulador de Estados de Procesos", 
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=ctk_font(20, "bold")
         )
         title_label.pack(pady=(15, 10))
         
@@ -95,14 +93,16 @@ class ControlPanel(ctk.CTkFrame):
         quantum_label = ctk.CTkLabel(config_frame, text="Quantum:")
         quantum_label.pack(side="left", padx=(0, 5))
         
+        # Sin variable Tk enlazada: el valor se lee del widget al confirmar
         self.quantum_entry = ctk.CTkEntry(
             config_frame,
-            textvariable=self.quantum_var,
             width=60,
             height=28
         )
+        self.quantum_entry.insert(0, "3")
         self.quantum_entry.pack(side="left", padx=5)
         self.quantum_entry.bind("<Return>", self._on_quantum_change)
+        self.quantum_entry.bind("<FocusOut>", self._on_quantum_change)
         
         # Velocidad
         speed_label = ctk.CTkLabel(config_frame, text="Velocidad:")
@@ -112,11 +112,11 @@ class ControlPanel(ctk.CTkFrame):
             config_frame,
             from_=0.1,
             to=5.0,
-            variable=self.speed_var,
             command=self._on_speed_change,
             width=120,
             height=20
         )
+        self.speed_slider.set(1.0)
         self.speed_slider.pack(side="left", padx=5)
         
         # Auto-crear
@@ -175,17 +175,18 @@ class ControlPanel(ctk.CTkFrame):
     def _on_quantum_change(self, event=None):
         """Maneja el cambio de quantum."""
         try:
-            quantum = max(1, self.quantum_var.get())
-            self.quantum_var.set(quantum)
-            if self.quantum_change_callback:
-                self.quantum_change_callback(quantum)
-        except:
-            self.quantum_var.set(3)  # Valor por defecto
+            quantum = max(1, int(self.quantum_entry.get()))
+        except ValueError:
+            self.set_quantum_value(3)  # Valor por defecto
+            return
+        self.set_quantum_value(quantum)
+        if self.quantum_change_callback:
+            self.quantum_change_callback(quantum)
     
     def _on_speed_change(self, value):
-        """Maneja el cambio de velocidad."""
+        """Maneja el cambio de velocidad (el slider ya entrega un float)."""
         if self.speed_change_callback:
-            self.speed_change_callback(float(value))
+            self.speed_change_callback(value)
     
     def _on_auto_create_change(self):
         """Maneja el cambio de auto-crear."""
@@ -201,6 +202,15 @@ class ControlPanel(ctk.CTkFrame):
         except ValueError:
             pass  # Ignorar seeds inválidos
     
+    def set_quantum_value(self, quantum: int):
+        """Muestra el quantum indicado en la entrada."""
+        self.quantum_entry.delete(0, "end")
+        self.quantum_entry.insert(0, str(quantum))
+    
+    def set_speed_value(self, speed: float):
+        """Coloca el slider de velocidad en el valor indicado."""
+        self.speed_slider.set(speed)
+    
     def _set_auto_running(self, running: bool):
         """Establece el estado de ejecución automática."""
         if running:
@@ -210,22 +220,6 @@ class ControlPanel(ctk.CTkFrame):
             self.start_button.configure(state="normal")
             self.pause_button.configure(state="disabled")
     
-    def add_manual_tick_button(self, parent_frame):
-        """Agrega el botón de tick manual al frame especificado."""
-        self.tick_manual_button = ctk.CTkButton(
-            parent_frame,
-            text="⚡ Tick Manual",
-            command=self._on_tick_manual,
-            width=120,
-            height=35
-        )
-        return self.tick_manual_button
-    
-    def _on_tick_manual(self):
-        """Maneja el tick manual."""
-        if self.tick_manual_callback:
-            self.tick_manual_callback()
-    
     # Métodos para establecer callbacks
     def set_start_auto_callback(self, callback: Callable):
         self.start_auto_callback = callback
@@ -236,9 +230,6 @@ class ControlPanel(ctk.CTkFrame):
     def set_reset_callback(self, callback: Callable):
         self.reset_callback = callback
     
-    def set_tick_manual_callback(self, callback: Callable):
-        self.tick_manual_callback = callback
-    
     def set_quantum_change_callback(self, callback: Callable):
         self.quantum_change_callback = callback
     
@@ -3,6 +3,24 @@ Panel de métricas del sistema.
 """
 import customtkinter as ctk
 from typing import Dict, Optional, Callable
+from ._fonts import ctk_font
+
+# Formato de display de cada métrica (métodos ligados: sin marco Python por llamada).
+# El texto formateado es también la clave de cambio: solo se reconfigura si difiere.
+_METRIC_FORMATTERS = {
+    "tick": str,
+    "total_processes": str,
+    "running": str,
+    "ready": str,
+    "priority_info": str,
+    "blocked": str,
+    "zombie": str,
+    "terminated": str,
+    "cpu_utilization": "{:.1f}%".format,
+    "context_switches": str,
+    "avg_turnaround": "{:.1f}".format,
+    "avg_waiting": "{:.1f}".format,
+}
 
 class MetricsPanel(ctk.CTkFrame):
     """Panel que muestra las métricas del sistema."""
@@ -11,6 +29,9 @@ class MetricsPanel(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         
         self.export_callback: Optional[Callable] = None
+        self._last_values: Dict[str, str] = {}  # Último texto mostrado por métrica
+        self._pending_metrics: Optional[Dict] = None  # Última instantánea aún sin dibujar
+        self._flush_scheduled = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -19,7 +40,7 @@ class MetricsPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self, 
             text="📊 Métricas del Sistema", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=ctk_font(14, "bold")
         )
         title_label.pack(pady=(8, 5))
         
@@ -47,7 +68,7 @@ class MetricsPanel(ctk.CTkFrame):
             command=self._on_export,
             width=100,  # Más estrecho
             height=26,  # Más bajo
-            font=ctk.CTkFont(size=9)
+            font=ctk_font(9)
         )
         self.export_button.pack(pady=(3, 6))
     
@@ -68,6 +89,10 @@ class MetricsPanel(ctk.CTkFrame):
             ("avg_waiting", "⏳ Tiempo Espera Promedio", "0.0")
         ]
         
+        # Fuentes compartidas por todas las filas (una sola fuente Tcl por estilo)
+        desc_font = ctk_font(9)
+        value_font = ctk_font(9, "bold")
+        
         for key, label_text, default_value in metrics_info:
             # Frame para cada métrica - más compacto
             metric_frame = ctk.CTkFrame(self.metrics_frame, fg_color="transparent", height=24)
@@ -82,7 +107,7 @@ class MetricsPanel(ctk.CTkFrame):
             desc_label = ctk.CTkLabel(
                 metric_frame,
                 text=label_text,
-                font=ctk.CTkFont(size=9),
+                font=desc_font,
                 anchor="w"
             )
             desc_label.grid(row=0, column=0, sticky="w", padx=(2, 3))
@@ -91,7 +116,7 @@ class MetricsPanel(ctk.CTkFrame):
             value_label = ctk.CTkLabel(
                 metric_frame,
                 text=default_value,
-                font=ctk.CTkFont(size=9, weight="bold"),
+                font=value_font,
                 anchor="center",
                 width=60,  # Más estrecho
                 height=20,  # Más bajo
@@ -101,30 +126,38 @@ class MetricsPanel(ctk.CTkFrame):
             value_label.grid(row=0, column=1, sticky="e", padx=(0, 2))
             
             self.metric_labels[key] = value_label
+            self._last_values[key] = default_value
+        
+        # Plan de actualización fijo: (clave, formato, label)
+        self._update_plan = [
+            (key, _METRIC_FORMATTERS[key], label) for key, label in self.metric_labels.items()
+        ]
     
     def update_metrics(self, metrics: Dict):
-        """Actualiza las métricas mostradas."""
-        # Mapeo de métricas a formato de display
-        metric_formats = {
-            "tick": lambda x: str(x),
-            "total_processes": lambda x: str(x),
-            "running": lambda x: str(x),
-            "ready": lambda x: str(x),
-            "priority_info": lambda x: str(x),
-            "blocked": lambda x: str(x),
-            "zombie": lambda x: str(x),
-            "terminated": lambda x: str(x),
-            "cpu_utilization": lambda x: f"{x:.1f}%",
-            "context_switches": lambda x: str(x),
-            "avg_turnaround": lambda x: f"{x:.1f}",
-            "avg_waiting": lambda x: f"{x:.1f}"
-        }
+        """Actualiza las métricas mostradas (agrupa las llamadas hasta que Tk esté libre)."""
+        self._pending_metrics = metrics
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_metrics)
+    
+    def _flush_metrics(self):
+        """Dibuja la última instantánea de métricas recibida."""
+        self._flush_scheduled = False
+        metrics = self._pending_metrics
+        self._pending_metrics = None
+        if metrics is None:
+            return
+        last_values = self._last_values
         
-        # Actualizar cada métrica
-        for key, formatter in metric_formats.items():
-            if key in metrics and key in self.metric_labels:
-                formatted_value = formatter(metrics[key])
-                self.metric_labels[key].configure(text=formatted_value)
+        # Actualizar cada métrica (solo las que cambiaron: configure cruza a Tcl)
+        for key, formatter, label in self._update_plan:
+            value = metrics.get(key)
+            if value is None:
+                continue
+            formatted_value = formatter(value)
+            if last_values.get(key) != formatted_value:
+                label.configure(text=formatted_value)
+                last_values[key] = formatted_value
     
     def _on_export(self):
         """Maneja la exportación de métricas."""
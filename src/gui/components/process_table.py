@@ -2,19 +2,75 @@
 Componente de tabla de procesos para la interfaz gráfica.
 """
 import customtkinter as ctk
+from itertools import islice
 from tkinter import ttk
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from ...models.process import Process
+from ._fonts import ctk_font
+
+# Filas extra dibujadas por debajo de la ventana visible
+_WINDOW_BUFFER = 2
+
+# Filas nuevas a partir de las cuales se inserta con el Treeview retirado del layout
+_BULK_THRESHOLD = 50
+
+# El estilo ttk es global: basta con configurarlo una vez por proceso
+_STYLE_CONFIGURED = False
+
+def _ensure_style() -> ttk.Style:
+    """Configura el estilo ttk del Treeview una sola vez."""
+    global _STYLE_CONFIGURED
+    style = ttk.Style()
+    if _STYLE_CONFIGURED:
+        return style
+    style.theme_use("clam")
+    
+    # Configurar colores para el tema oscuro
+    style.configure("Treeview", 
+                   background="#2b2b2b",
+                   foreground="white",
+                   fieldbackground="#2b2b2b",
+                   borderwidth=0)
+    style.configure("Treeview.Heading",
+                   background="#1f538d",
+                   foreground="white",
+                   borderwidth=1)
+    style.map("Treeview.Heading",
+             background=[('active', '#14375e')])
+    style.map("Treeview",
+             background=[('selected', '#1f538d')])
+    _STYLE_CONFIGURED = True
+    return style
 
 class ProcessTable(ctk.CTkFrame):
     """Tabla de procesos con funcionalidad de selección."""
     
+    # Colores por estado
+    STATE_COLORS = {
+        'NEW': '#FFA500',      # Naranja
+        'READY': '#00CED1',    # Turquesa
+        'RUNNING': '#32CD32',  # Verde lima
+        'BLOCKED': '#FF6347',  # Rojo tomate
+        'ZOMBIE': '#9370DB',   # Violeta medio
+        'TERMINATED': '#696969' # Gris oscuro
+    }
+    # Tupla de tags de cada estado (lista para pasar a insert/item)
+    STATE_TAGS = {state: (f"state_{state}",) for state in STATE_COLORS}
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.selected_pid: Optional[int] = None
         self.selection_callback: Optional[Callable] = None
         
+        # Modelo completo de la tabla; solo se dibuja la ventana visible
+        self._model: Dict[int, tuple] = {}
+        self._all_pids_sorted: List[int] = []
+        self._first = 0  # Índice (en _all_pids_sorted) de la primera fila dibujada
+        
+        # Filas ya dibujadas: pid -> (item_id, valores mostrados)
+        self._row_cache: Dict[int, Tuple[str, tuple]] = {}
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -23,7 +79,7 @@ class ProcessTable(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self, 
             text="📋 Tabla de Procesos", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ctk_font(16, "bold")
         )
         title_label.pack(pady=(10, 5))
         
@@ -32,23 +88,7 @@ class ProcessTable(ctk.CTkFrame):
         table_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         # Crear Treeview con estilo personalizado
-        style = ttk.Style()
-        style.theme_use("clam")
-        
-        # Configurar colores para el tema oscuro
-        style.configure("Treeview", 
-                       background="#2b2b2b",
-                       foreground="white",
-                       fieldbackground="#2b2b2b",
-                       borderwidth=0)
-        style.configure("Treeview.Heading",
-                       background="#1f538d",
-                       foreground="white",
-                       borderwidth=1)
-        style.map("Treeview.Heading",
-                 background=[('active', '#14375e')])
-        style.map("Treeview",
-                 background=[('selected', '#1f538d')])
+        style = _ensure_style()
         
         # Definir columnas - agregada columna de Prioridad
         columns = ("PID", "Nombre", "Estado", "Prioridad", "Restante", "Total", "Padre", 
@@ -67,14 +107,19 @@ class ProcessTable(ctk.CTkFrame):
             self.tree.heading(col, text=col)
             self.tree.column(col, width=column_widths.get(col, 80), minwidth=50)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        # Tags de color por estado, configurados una sola vez
+        for state, color in self.STATE_COLORS.items():
+            self.tree.tag_configure(self.STATE_TAGS[state][0], background=color, foreground='black')
+        
+        # Scrollbars (la vertical recorre el modelo completo, no las filas dibujadas)
+        self.v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self._on_yscroll)
         h_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+        self._row_px = int(style.lookup("Treeview", "rowheight") or 20)
         
         # Pack elementos
         self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
         h_scrollbar.grid(row=1, column=0, sticky="ew")
         
         table_frame.grid_rowconfigure(0, weight=1)
@@ -82,73 +127,141 @@ class ProcessTable(ctk.CTkFrame):
         
         # Bind eventos
         self.tree.bind("<<TreeviewSelect>>", self._on_selection_change)
+        self.tree.bind("<Configure>", lambda event: self._render_window())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
     
     def _on_selection_change(self, event):
         """Maneja el cambio de selección en la tabla."""
         selection = self.tree.selection()
         if selection:
-            item = self.tree.item(selection[0])
             try:
-                self.selected_pid = int(item['values'][0])  # PID está en la primera columna
+                self.selected_pid = int(selection[0])  # El iid de cada fila es su PID
                 if self.selection_callback:
                     self.selection_callback(self.selected_pid)
             except (ValueError, IndexError):
                 self.selected_pid = None
-        else:
+        elif self.selected_pid in self._row_cache:
+            # Deselección de una fila visible (si salió de la ventana se conserva)
             self.selected_pid = None
     
     def set_selection_callback(self, callback: Callable):
         """Establece el callback para cambios de selección."""
         self.selection_callback = callback
     
-    def update_processes(self, process_table: Dict[int, Process]):
-        """Actualiza la tabla con los procesos actuales."""
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Colores por estado
-        state_colors = {
-            'NEW': '#FFA500',      # Naranja
-            'READY': '#00CED1',    # Turquesa
-            'RUNNING': '#32CD32',  # Verde lima
-            'BLOCKED': '#FF6347',  # Rojo tomate
-            'ZOMBIE': '#9370DB',   # Violeta medio
-            'TERMINATED': '#696969' # Gris oscuro
-        }
+    def update_processes(self, process_table: Dict[int, Process], sorted_pids: Optional[List[int]] = None):
+        """Actualiza la tabla con los procesos actuales (solo las filas visibles que cambiaron)."""
+        # Índice ordenado mantenido por el simulador; sin él se ordena aquí
+        if sorted_pids is None:
+            sorted_pids = sorted(process_table)
         
-        # Agregar procesos
-        for pid, process in sorted(process_table.items()):
-            if pid == 0:  # Saltar proceso init en la tabla
-                continue
-                
-            values = (
-                process.pid,
-                process.name,
-                process.state,
-                process.priority,  # Nueva columna de prioridad
-                process.remaining_burst if process.remaining_burst > 0 else "-",
-                process.total_burst,
-                process.parent_pid if process.parent_pid else "-",
-                process.io_remaining if process.io_remaining > 0 else "-",
-                process.created_tick,
-                process.start_tick if process.start_tick else "-",
-                process.end_tick if process.end_tick else "-",
-                process.blocked_count,
-                process.preempt_count
+        # init (PID 0) es siempre el primero del índice: se salta por posición, sin comparar cada fila
+        start = 1 if sorted_pids and sorted_pids[0] == 0 else 0
+        
+        # Valores actuales por PID, ya en orden de PID (atributos leídos una vez a locales)
+        new_values = {}
+        for pid in islice(sorted_pids, start, None):
+            p = process_table[pid]
+            rb, io, sp, st, et = p.remaining_burst, p.io_remaining, p.parent_pid, p.start_tick, p.end_tick
+            new_values[pid] = (
+                pid,
+                p.name,
+                p.state,
+                p.priority,  # Nueva columna de prioridad
+                rb if rb > 0 else "-",
+                p.total_burst,
+                sp if sp else "-",
+                io if io > 0 else "-",
+                p.created_tick,
+                st if st else "-",
+                et if et else "-",
+                p.blocked_count,
+                p.preempt_count
             )
-            
-            item_id = self.tree.insert("", "end", values=values)
-            
-            # Aplicar color según estado
-            state_color = state_colors.get(process.state, '#FFFFFF')
-            self.tree.set(item_id, "Estado", process.state)
-            
-            # Configurar tags para colores
-            tag_name = f"state_{process.state}"
-            # Configurar el tag (si ya existe, simplemente se reconfigura)
-            self.tree.tag_configure(tag_name, background=state_color, foreground='black')
-            self.tree.item(item_id, tags=(tag_name,))
+        
+        self._model = new_values
+        self._all_pids_sorted = list(new_values)
+        self._render_window()
+    
+    def _visible_rows(self) -> int:
+        """Número de filas que caben en el área visible del Treeview."""
+        return max(int(self.tree.cget("height")), self.tree.winfo_height() // self._row_px)
+    
+    def _render_window(self):
+        """Dibuja solo las filas de la ventana visible y sincroniza la scrollbar."""
+        pids = self._all_pids_sorted
+        total = len(pids)
+        visible = self._visible_rows()
+        self._first = first = max(0, min(self._first, total - visible))
+        model = self._model
+        window = {pid: model[pid] for pid in pids[first:first + visible + _WINDOW_BUFFER]}
+        
+        if len(window.keys() - self._row_cache.keys()) > _BULK_THRESHOLD:
+            self._bulk_update(window)
+        else:
+            self._apply_rows(window)
+        
+        if total:
+            self.v_scrollbar.set(first / total, min(1.0, (first + visible) / total))
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+    
+    def _on_yscroll(self, action: str, amount: str, unit: str = None):
+        """Desplaza la ventana de filas según la scrollbar vertical."""
+        if action == "moveto":
+            self._first = int(float(amount) * len(self._all_pids_sorted))
+        else:
+            step = self._visible_rows() if unit == "pages" else 1
+            self._first += int(amount) * step
+        self._render_window()
+    
+    def _on_mousewheel(self, event):
+        """Desplaza la ventana con la rueda del ratón."""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._on_yscroll("scroll", "-3", "units")
+        else:
+            self._on_yscroll("scroll", "3", "units")
+        return "break"
+    
+    def _bulk_update(self, new_values: Dict[int, tuple]):
+        """Aplica muchas filas nuevas con el Treeview fuera del layout (un solo recálculo)."""
+        self.tree.grid_remove()
+        try:
+            self._apply_rows(new_values)
+        finally:
+            self.tree.grid()
+    
+    def _apply_rows(self, new_values: Dict[int, tuple]):
+        """Sincroniza las filas del Treeview con los valores dados (en orden de PID)."""
+        tree_insert = self.tree.insert
+        tree_item = self.tree.item
+        state_tags = self.STATE_TAGS
+        cache = self._row_cache
+        
+        # Eliminar las filas de procesos que ya no existen
+        removed = cache.keys() - new_values.keys()
+        if removed:
+            self.tree.delete(*[cache.pop(pid)[0] for pid in removed])
+        
+        # Insertar nuevos y reconfigurar solo las filas cuyo contenido cambió
+        for index, (pid, values) in enumerate(new_values.items()):
+            state = values[2]
+            cached = cache.get(pid)
+            if cached is None:
+                item_id = tree_insert("", index, iid=str(pid), values=values, tags=state_tags[state])
+                cache[pid] = (item_id, values)
+                if pid == self.selected_pid:
+                    self.tree.selection_set(item_id)  # Restaurar la selección al volver a la ventana
+                continue
+            item_id, old_values = cached
+            if old_values == values:
+                continue
+            if old_values[2] != state:
+                tree_item(item_id, values=values, tags=state_tags[state])
+            else:
+                tree_item(item_id, values=values)
+            cache[pid] = (item_id, values)
     
     def get_selected_pid(self) -> Optional[int]:
         """Obtiene el PID del proceso seleccionado."""
@@ -4,14 +4,30 @@ Ventana principal de la aplicación.
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, filedialog
-import threading
-import time
-import random
 import csv
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
 from ..core.simulator import SimulatorEngine
 from .components import ProcessTable, ControlPanel, ActionPanel, MetricsPanel
 
+def _write_metrics_csv(filename: str, metrics: dict, rows: List[tuple]):
+    """Escribe el CSV de métricas (se ejecuta fuera del hilo de Tk, sin tocar widgets)."""
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        
+        # Escribir encabezados
+        writer.writerow(['Métrica', 'Valor'])
+        
+        # Escribir métricas
+        writer.writerows(metrics.items())
+        
+        # Escribir información de procesos
+        writer.writerow([])
+        writer.writerow(['Información de Procesos'])
+        writer.writerow(['PID', 'Nombre', 'Estado', 'Total Burst', 'Restante', 
+                       'Padre', 'Creado', 'Inicio', 'Fin', 'Turnaround', 'Waiting'])
+        writer.writerows(rows)
+
 class MainWindow:
     """Ventana principal del simulador de procesos."""
     
@@ -37,7 +53,9 @@ class MainWindow:
         
         # Variables de control
         self.is_running = False
-        self.auto_thread: Optional[threading.Thread] = None
+        self._after_id: Optional[str] = None  # Próximo tick automático programado en Tk
+        self._update_pending = False  # Hay un repintado programado para cuando Tk esté libre
+        self._io_executor = ThreadPoolExecutor(max_workers=1)  # Escritura de CSV fuera del hilo de Tk
         self.speed = 1.0
         self.auto_create_enabled = False
         
@@ -52,7 +70,7 @@ class MainWindow:
         """Crea procesos iniciales opcionalmente."""
         for i in range(1, count + 1):
             self.simulator.create_process(f"P{i}")
-        self._update_display()
+        self._request_update()
     
     def _setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -81,7 +99,18 @@ class MainWindow:
         right_panel.grid_columnconfigure(0, weight=1)
         
         # Panel de acciones (arriba derecha)
-        self.action_panel = ActionPanel(right_panel)
+        self.action_panel = ActionPanel(
+            right_panel,
+            on_create_process=self._create_process,
+            on_create_child=self._create_child_process,
+            on_change_priority=self._change_process_priority,
+            on_new_to_ready=self._move_new_to_ready,
+            on_force_block=self._force_block_process,
+            on_force_terminate=self._force_terminate_process,
+            on_wait_reap=self._wait_reap_process,
+            on_show_tree=self._show_process_tree,
+            tick_command=self._manual_tick
+        )
         self.action_panel.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 2))
         
         # Panel de métricas (abajo derecha)
@@ -102,17 +131,6 @@ class MainWindow:
         # Process table callbacks
         self.process_table.set_selection_callback(self._on_process_selection)
         
-        # Action panel callbacks
-        self.action_panel.set_create_process_callback(self._create_process)
-        self.action_panel.set_create_child_callback(self._create_child_process)
-        self.action_panel.set_change_priority_callback(self._change_process_priority)
-        self.action_panel.set_new_to_ready_callback(self._move_new_to_ready)
-        self.action_panel.set_force_block_callback(self._force_block_process)
-        self.action_panel.set_force_terminate_callback(self._force_terminate_process)
-        self.action_panel.set_wait_reap_callback(self._wait_reap_process)
-        self.action_panel.set_show_tree_callback(self._show_process_tree)
-        self.action_panel.set_tick_manual_callback(self._manual_tick)
-        
         # Metrics panel callbacks
         self.metrics_panel.set_export_callback(self._export_metrics)
     
@@ -128,55 +146,71 @@ class MainWindow:
         """Inicia la simulación automática."""
         if not self.is_running:
             self.is_running = True
-            self.auto_thread = threading.Thread(target=self._auto_simulation_loop, daemon=True)
-            self.auto_thread.start()
+            self._schedule_next_tick()
     
     def _pause_simulation(self):
         """Pausa la simulación automática."""
         self.is_running = False
+        self._cancel_next_tick()
     
     def _reset_simulation(self):
         """Reinicia la simulación."""
         self.is_running = False
-        if self.auto_thread:
-            self.auto_thread.join(timeout=1.0)
+        self._cancel_next_tick()
         
         self.simulator.reset()
-        self._update_display()
+        self._request_update()
         
         # Limpiar selección
         self.action_panel.update_selection(None)
     
-    def _auto_simulation_loop(self):
-        """Loop principal de simulación automática."""
-        while self.is_running:
-            try:
-                # Ejecutar tick
-                self.simulator.tick_simulation()
-                
-                # Auto-crear procesos si está habilitado
-                if self.auto_create_enabled and random.random() < self.simulator.p_create:
-                    self.simulator.create_process()
-                
-                # Actualizar interfaz en el hilo principal
-                self.root.after(0, self._update_display)
-                
-                # Esperar según la velocidad
-                time.sleep(1.0 / self.speed)
-                
-            except Exception as e:
-                print(f"Error en simulación: {e}")
-                break
+    def _schedule_next_tick(self):
+        """Programa el siguiente tick automático según la velocidad."""
+        self._after_id = self.root.after(max(1, int(1000 / self.speed)), self._auto_tick)
+    
+    def _cancel_next_tick(self):
+        """Cancela el tick automático pendiente, si lo hay."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _auto_tick(self):
+        """Ejecuta un tick automático en el hilo de Tk y programa el siguiente."""
+        self._after_id = None
+        if not self.is_running:
+            return
+        try:
+            # Ejecutar tick (auto-crear con los saltos geométricos del motor: sin sorteo por tick)
+            self.simulator.advance(1, auto_create=self.auto_create_enabled)
+            
+            self._request_update()
+        except Exception as e:
+            print(f"Error en simulación: {e}")
+            self.is_running = False
+            return
+        
+        self._schedule_next_tick()
     
     def _manual_tick(self):
         """Ejecuta un tick manual."""
         self.simulator.tick_simulation()
+        self._request_update()
+    
+    def _request_update(self):
+        """Programa un repintado; varias peticiones seguidas se agrupan en uno."""
+        if not self._update_pending:
+            self._update_pending = True
+            self.root.after_idle(self._flush_update)
+    
+    def _flush_update(self):
+        """Ejecuta el repintado agrupado."""
+        self._update_pending = False
         self._update_display()
     
     def _update_display(self):
         """Actualiza toda la interfaz."""
         # Actualizar tabla de procesos
-        self.process_table.update_processes(self.simulator.process_table)
+        self.process_table.update_processes(self.simulator.process_table, self.simulator.sorted_pids)
         
         # Actualizar métricas
         metrics = self.simulator.get_metrics()
@@ -185,7 +219,7 @@ class MainWindow:
     def _create_process(self):
         """Crea un nuevo proceso."""
         pid = self.simulator.create_process()
-        self._update_display()
+        self._request_update()
         messagebox.showinfo("Proceso Creado", f"Proceso creado con PID {pid}")
     
     def _create_child_process(self, parent_pid: int):
@@ -193,7 +227,7 @@ class MainWindow:
         if parent_pid in self.simulator.process_table:
             parent_name = self.simulator.process_table[parent_pid].name
             child_pid = self.simulator.create_process(parent_pid=parent_pid)
-            self._update_display()
+            self._request_update()
             messagebox.showinfo(
                 "Proceso Hijo Creado", 
                 f"Proceso hijo creado con PID {child_pid}\nPadre: {parent_name} (PID {parent_pid})"
@@ -271,8 +305,8 @@ class MainWindow:
                 new_priority = int(priority_var.get())
                 if 0 <= new_priority <= 9:
                     old_priority = process.priority
-                    self.simulator.scheduler.adjust_priority(pid, new_priority, self.simulator.process_table)
-                    self._update_display()
+                    self.simulator.adjust_priority(pid, new_priority)
+                    self._request_update()
                     dialog.destroy()
                     messagebox.showinfo(
                         "Prioridad Cambiada", 
@@ -311,13 +345,13 @@ class MainWindow:
     def _move_new_to_ready(self):
         """Mueve todos los procesos NEW a READY."""
         count = self.simulator.move_new_to_ready()
-        self._update_display()
+        self._request_update()
         messagebox.showinfo("Transición Completada", f"{count} procesos movidos de NEW a READY")
     
     def _force_block_process(self, pid: int):
         """Fuerza el bloqueo de un proceso."""
         if self.simulator.force_block_process(pid):
-            self._update_display()
+            self._request_update()
             messagebox.showinfo("Proceso Bloqueado", f"Proceso PID {pid} forzado a BLOCKED")
         else:
             messagebox.showerror("Error", "No se pudo bloquear el proceso")
@@ -325,7 +359,7 @@ class MainWindow:
     def _force_terminate_process(self, pid: int):
         """Fuerza la terminación de un proceso."""
         if self.simulator.force_terminate_process(pid):
-            self._update_display()
+            self._request_update()
             messagebox.showinfo("Proceso Terminado", f"Proceso PID {pid} forzado a terminar")
         else:
             messagebox.showerror("Error", "No se pudo terminar el proceso")
@@ -333,7 +367,7 @@ class MainWindow:
     def _wait_reap_process(self, pid: int):
         """Ejecuta wait() para reapear procesos zombie."""
         reaped = self.simulator.wait_for_child(pid)
-        self._update_display()
+        self._request_update()
         if reaped:
             messagebox.showinfo(
                 "Procesos Reapeados", 
@@ -360,18 +394,24 @@ class MainWindow:
     
     def _format_process_tree(self, tree: dict, level: int = 0) -> str:
         """Formatea el árbol de procesos para mostrar."""
-        result = ""
-        for pid, subtree in tree.items():
-            if 'process' in subtree:
-                process = subtree['process']
-                indent = "  " * level
-                result += f"{indent}├─ PID {pid}: {process.name} [{process.state}]\n"
-                
-                # Recursivamente agregar hijos
-                if subtree['children']:
-                    result += self._format_process_tree(subtree['children'], level + 1)
-        
-        return result if result else "No hay procesos en el árbol"
+        lines = []
+        # Pila explícita de iteradores por nivel (sin recursión ni concatenación cuadrática)
+        stack = [(iter(tree.items()), level)]
+        while stack:
+            items, depth = stack[-1]
+            for pid, subtree in items:
+                if 'process' in subtree:
+                    process = subtree['process']
+                    lines.append(f"{'  ' * depth}├─ PID {pid}: {process.name} [{process.state}]\n")
+                    
+                    # Descender a los hijos antes de seguir con los hermanos
+                    if subtree['children']:
+                        stack.append((iter(subtree['children'].items()), depth + 1))
+                        break
+            else:
+                stack.pop()
+        
+        return "".join(lines) or "No hay procesos en el árbol"
     
     def _export_metrics(self):
         """Exporta las métricas a un archivo CSV."""
@@ -383,45 +423,31 @@ class MainWindow:
             )
             
             if filename:
+                # Instantánea en el hilo de Tk: el hilo de escritura no toca el simulador
                 metrics = self.simulator.get_metrics()
+                rows = [
+                    (p.pid, p.name, p.state, p.total_burst, p.remaining_burst, p.parent_pid or '',
+                     p.created_tick, p.start_tick or '', p.end_tick or '', p.turnaround or '', p.waiting or '')
+                    for p in self.simulator.process_table.values() if p.pid != 0  # Saltar proceso init
+                ]
                 
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Escribir encabezados
-                    writer.writerow(['Métrica', 'Valor'])
-                    
-                    # Escribir métricas
-                    for key, value in metrics.items():
-                        writer.writerow([key, value])
-                    
-                    # Escribir información de procesos
-                    writer.writerow([])
-                    writer.writerow(['Información de Procesos'])
-                    writer.writerow(['PID', 'Nombre', 'Estado', 'Total Burst', 'Restante', 
-                                   'Padre', 'Creado', 'Inicio', 'Fin', 'Turnaround', 'Waiting'])
-                    
-                    for pid, process in self.simulator.process_table.items():
-                        if pid != 0:  # Saltar proceso init
-                            writer.writerow([
-                                process.pid,
-                                process.name,
-                                process.state,
-                                process.total_burst,
-                                process.remaining_burst,
-                                process.parent_pid or '',
-                                process.created_tick,
-                                process.start_tick or '',
-                                process.end_tick or '',
-                                process.get_turnaround_time() or '',
-                                process.get_waiting_time() or ''
-                            ])
-                
-                messagebox.showinfo("Exportación Exitosa", f"Métricas exportadas a:\n{filename}")
+                future = self._io_executor.submit(_write_metrics_csv, filename, metrics, rows)
+                self._poll_export(future, filename)
                 
         except Exception as e:
             messagebox.showerror("Error de Exportación", f"Error al exportar métricas:\n{str(e)}")
     
+    def _poll_export(self, future: Future, filename: str):
+        """Comprueba desde el hilo de Tk si terminó la exportación y avisa del resultado."""
+        if not future.done():
+            self.root.after(50, self._poll_export, future, filename)
+            return
+        error = future.exception()
+        if error is None:
+            messagebox.showinfo("Exportación Exitosa", f"Métricas exportadas a:\n{filename}")
+        else:
+            messagebox.showerror("Error de Exportación", f"Error al exportar métricas:\n{str(error)}")
+    
     def _on_quantum_change(self, quantum: int):
         """Maneja el cambio de quantum."""
         self.simulator.set_quantum(quantum)
@@ -436,7 +462,7 @@ class MainWindow:
     
     def _on_seed_apply(self, seed: int):
         """Aplica una semilla para reproducibilidad."""
-        random.seed(seed)
+        self.simulator.set_seed(seed)
         messagebox.showinfo("Seed Aplicado", f"Semilla {seed} aplicada para reproducibilidad")
     
     def run(self):
@@ -1,6 +1,6 @@
 """
 Modelos de datos del simulador.
 """
-from .process import Process
+from .process import PROCESS_STATES, Process
 
-__all__ = ['Process']
+__all__ = ['PROCESS_STATES', 'Process']
@@ -1,10 +1,20 @@
 """
 Modelo de datos para procesos del sistema.
 """
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Set
 
-@dataclass
+# Estados posibles de un proceso
+PROCESS_STATES = ('NEW', 'READY', 'RUNNING', 'BLOCKED', 'ZOMBIE', 'TERMINATED')
+
+# Estados en los que el proceso ya terminó (pertenencia O(1))
+_FINISHED_STATES = frozenset({'TERMINATED', 'ZOMBIE'})
+
+# __slots__ generados por dataclass solo existen desde Python 3.10 (el proyecto admite 3.8+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class Process:
     """Clase que representa un proceso en el sistema."""
     pid: int
@@ -14,12 +24,15 @@ class Process:
     remaining_burst: int = 0
     priority: int = 0  # Prioridad del proceso (0=más alta, mayor número=menor prioridad)
     parent_pid: Optional[int] = None
-    children: List[int] = field(default_factory=list)
+    children: List[int] = field(default_factory=list)  # Orden de creación (para mostrar)
+    children_set: Set[int] = field(default_factory=set, repr=False)  # Pertenencia O(1)
     
     # Métricas de tiempo
     created_tick: int = 0
     start_tick: Optional[int] = None
     end_tick: Optional[int] = None
+    turnaround: Optional[int] = None  # Fijados por el simulador al terminar
+    waiting: Optional[int] = None
     
     # Contadores
     blocked_count: int = 0
@@ -30,6 +43,20 @@ class Process:
     waiting_for_child: bool = False
     reaped: bool = False
     
+    def __post_init__(self):
+        """Interna el estado recibido (los literales del código ya lo están)."""
+        self.state = sys.intern(self.state)
+    
+    def __eq__(self, other) -> bool:
+        """Dos procesos son iguales si tienen el mismo PID."""
+        if not isinstance(other, Process):
+            return NotImplemented
+        return self.pid == other.pid
+    
+    def __hash__(self) -> int:
+        """El PID identifica al proceso (hash O(1) sin recorrer campos)."""
+        return hash(self.pid)
+    
     def get_turnaround_time(self) -> Optional[int]:
         """Calcula el turnaround time del proceso."""
         if self.end_tick is not None:
@@ -44,4 +71,4 @@ class Process:
     
     def is_finished(self) -> bool:
         """Verifica si el proceso ha terminado."""
-        return self.state in ['TERMINATED', 'ZOMBIE']
+        return self.state in _FINISHED_STATES
@@ -2,117 +2,155 @@
 Utilidades para exportar datos a CSV.
 """
 import csv
-from typing import Dict, List
+import io
+import os
+from typing import Dict, List, Sequence
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from ..models.process import Process
 
+# Encabezados fijos de las tablas exportadas
+_PROCESS_HEADER = (
+    'PID', 'Nombre', 'Estado', 'Total_Burst', 'Restante_Burst',
+    'Padre_PID', 'Creado_Tick', 'Inicio_Tick', 'Fin_Tick',
+    'Turnaround_Time', 'Waiting_Time', 'Blocked_Count', 'Preempt_Count'
+)
+_METRICS_HEADER = ('Métrica', 'Valor')
+
+# Formato de la marca de tiempo de cada exportación
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Campos directos de cada fila de proceso, leídos de una vez en C
+_PROCESS_FIELDS = attrgetter(
+    'pid', 'name', 'state', 'total_burst', 'remaining_burst', 'parent_pid',
+    'created_tick', 'start_tick', 'end_tick', 'blocked_count', 'preempt_count'
+)
+
+# Caracteres que obligan a csv.writer a entrecomillar un campo
+_CSV_SPECIAL = frozenset(',"\r\n')
+
+# Eventos del log incluidos en el reporte completo
+_MAX_EVENT_ROWS = 50
+
+# Secciones fijas del reporte completo, ya en formato CSV (terminador \r\n como csv.writer).
+# Ningún campo lleva separadores ni comillas, así que no necesitan pasar por el escapado del writer.
+_REPORT_BANNER = (
+    "Reporte Completo del Simulador de Procesos\r\n"
+    "Generado:,{ts}\r\n"
+    "\r\n"
+    "=== MÉTRICAS DEL SISTEMA ===\r\n"
+    + ",".join(_METRICS_HEADER) + "\r\n"
+)
+_PROCESS_HEADER_LINE = ",".join(_PROCESS_HEADER) + "\r\n"
+_REPORT_PROCESSES_SECTION = (
+    "\r\n"
+    "=== INFORMACIÓN DE PROCESOS ===\r\n"
+)
+_REPORT_EVENTS_SECTION = (
+    "\r\n"
+    f"=== LOG DE EVENTOS (Últimos {_MAX_EVENT_ROWS}) ===\r\n"
+    "Evento\r\n"
+)
+
+# Flags de apertura para volcar el CSV con os.write (O_BINARY evita traducir \n en Windows)
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def _write_buffered(filename: str, content: str):
+    """Escribe el contenido ya generado con una llamada os.write (sin capas de búfer de Python)."""
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(filename, _OPEN_FLAGS, 0o644)
+    try:
+        # os.write puede escribir menos bytes de los pedidos: repetir con el resto
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _write_process_rows(buffer: io.StringIO, writer, rows: List[tuple]):
+    """Escribe filas de procesos; si ningún nombre necesita escapado, sin pasar por csv.writer."""
+    # Sólo el nombre es texto libre: el resto son enteros, '' o estados conocidos
+    if any(_CSV_SPECIAL.intersection(row[1]) for row in rows):
+        writer.writerows(rows)
+        return
+    buffer.write("".join([",".join(map(str, row)) + "\r\n" for row in rows]))
+
 class CSVExporter:
     """Exportador de datos a formato CSV."""
     
+    @staticmethod
+    def _build_process_rows(process_table: Dict[int, Process]) -> List[tuple]:
+        """Filas de procesos (sin init) en orden de PID, listas para writerows."""
+        rows = []
+        for pid, p in sorted(process_table.items()):
+            if not pid:  # Saltar proceso init
+                continue
+            f = _PROCESS_FIELDS(p)
+            rows.append(f[:5] + (f[5] or '', f[6], f[7] or '', f[8] or '', p.get_turnaround_time() or '',
+                                 p.get_waiting_time() or '', f[9], f[10]))
+        return rows
+    
+    @staticmethod
+    def _write_process_table(buffer: io.StringIO, writer, process_table: Dict[int, Process]):
+        """Escribe encabezado y filas de procesos; compartido por ambos exportadores."""
+        buffer.write(_PROCESS_HEADER_LINE)
+        _write_process_rows(buffer, writer, CSVExporter._build_process_rows(process_table))
+    
     @staticmethod
     def export_metrics(metrics: Dict, filename: str):
         """Exporta métricas del sistema a CSV."""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Encabezado
-            writer.writerow(['Timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-            writer.writerow([])
-            writer.writerow(['Métricas del Sistema'])
-            writer.writerow(['Métrica', 'Valor'])
-            
-            # Métricas
-            for key, value in metrics.items():
-                writer.writerow([key, value])
+        now_str = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        # Encabezado
+        writer.writerow(['Timestamp', now_str])
+        writer.writerow([])
+        writer.writerow(['Métricas del Sistema'])
+        writer.writerow(_METRICS_HEADER)
+        
+        # Métricas
+        writer.writerows(metrics.items())
+        
+        _write_buffered(filename, buffer.getvalue())
     
     @staticmethod
     def export_processes(process_table: Dict[int, Process], filename: str):
         """Exporta información de procesos a CSV."""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Encabezado
-            writer.writerow(['Timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-            writer.writerow([])
-            writer.writerow(['Información de Procesos'])
-            writer.writerow([
-                'PID', 'Nombre', 'Estado', 'Total_Burst', 'Restante_Burst',
-                'Padre_PID', 'Creado_Tick', 'Inicio_Tick', 'Fin_Tick',
-                'Turnaround_Time', 'Waiting_Time', 'Blocked_Count', 'Preempt_Count'
-            ])
-            
-            # Procesos (excluyendo init)
-            for pid, process in sorted(process_table.items()):
-                if pid == 0:  # Saltar proceso init
-                    continue
-                
-                writer.writerow([
-                    process.pid,
-                    process.name,
-                    process.state,
-                    process.total_burst,
-                    process.remaining_burst,
-                    process.parent_pid or '',
-                    process.created_tick,
-                    process.start_tick or '',
-                    process.end_tick or '',
-                    process.get_turnaround_time() or '',
-                    process.get_waiting_time() or '',
-                    process.blocked_count,
-                    process.preempt_count
-                ])
+        now_str = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        # Encabezado
+        writer.writerow(['Timestamp', now_str])
+        writer.writerow([])
+        writer.writerow(['Información de Procesos'])
+        
+        # Procesos (excluyendo init)
+        CSVExporter._write_process_table(buffer, writer, process_table)
+        
+        _write_buffered(filename, buffer.getvalue())
     
     @staticmethod
     def export_complete_report(metrics: Dict, process_table: Dict[int, Process], 
-                             event_logs: List[str], filename: str):
+                             event_logs: Sequence[str], filename: str):
         """Exporta un reporte completo del sistema."""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Encabezado del reporte
-            writer.writerow(['Reporte Completo del Simulador de Procesos'])
-            writer.writerow(['Generado:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-            writer.writerow([])
-            
-            # Métricas del sistema
-            writer.writerow(['=== MÉTRICAS DEL SISTEMA ==='])
-            writer.writerow(['Métrica', 'Valor'])
-            for key, value in metrics.items():
-                writer.writerow([key, value])
-            writer.writerow([])
-            
-            # Información de procesos
-            writer.writerow(['=== INFORMACIÓN DE PROCESOS ==='])
-            writer.writerow([
-                'PID', 'Nombre', 'Estado', 'Total_Burst', 'Restante_Burst',
-                'Padre_PID', 'Creado_Tick', 'Inicio_Tick', 'Fin_Tick',
-                'Turnaround_Time', 'Waiting_Time', 'Blocked_Count', 'Preempt_Count'
-            ])
-            
-            for pid, process in sorted(process_table.items()):
-                if pid == 0:  # Saltar proceso init
-                    continue
-                
-                writer.writerow([
-                    process.pid,
-                    process.name,
-                    process.state,
-                    process.total_burst,
-                    process.remaining_burst,
-                    process.parent_pid or '',
-                    process.created_tick,
-                    process.start_tick or '',
-                    process.end_tick or '',
-                    process.get_turnaround_time() or '',
-                    process.get_waiting_time() or '',
-                    process.blocked_count,
-                    process.preempt_count
-                ])
-            
-            writer.writerow([])
-            
-            # Log de eventos (últimos 50)
-            writer.writerow(['=== LOG DE EVENTOS (Últimos 50) ==='])
-            writer.writerow(['Evento'])
-            for event in event_logs:
-                writer.writerow([event])
+        now_str = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        # Métricas del sistema
+        buffer.write(_REPORT_BANNER.format(ts=now_str))
+        writer.writerows(metrics.items())
+        
+        # Información de procesos
+        buffer.write(_REPORT_PROCESSES_SECTION)
+        CSVExporter._write_process_table(buffer, writer, process_table)
+        
+        # Log de eventos (últimos 50)
+        buffer.write(_REPORT_EVENTS_SECTION)
+        # islice en lugar de rebanar: acepta también logs en deque, que no admiten slices
+        recent = islice(event_logs, max(0, len(event_logs) - _MAX_EVENT_ROWS), None)
+        writer.writerows((event,) for event in recent)
+        
+        _write_buffered(filename, buffer.getvalue())
@@ -1,9 +1,47 @@
 """
 Utilidades para formatear y mostrar árboles de procesos.
 """
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from ..models.process import Process
 
+# Sangrías ya construidas por nivel (crece bajo demanda: una cadena por profundidad)
+_INDENT_CACHE = [""]
+
+def _indent(level: int) -> str:
+    """Devuelve la sangría de un nivel del árbol."""
+    while len(_INDENT_CACHE) <= level:
+        _INDENT_CACHE.append("  " * len(_INDENT_CACHE))
+    return _INDENT_CACHE[level]
+
+def _to_soa(tree: Dict) -> Tuple[List[Process], List[int], List[int], List[int]]:
+    """Aplana el árbol en arreglos paralelos: proceso, nivel, primer hijo y siguiente hermano (-1 = ninguno)."""
+    processes: List[Process] = []
+    levels: List[int] = []
+    first_child: List[int] = []
+    next_sibling: List[int] = []
+    
+    # Recorrido por grupos de hermanos; la lista crece mientras se itera
+    groups = [(tree, -1, 0)]
+    for children, parent, level in groups:
+        prev = -1
+        for subtree in children.values():
+            if 'process' not in subtree:
+                continue
+            node = len(processes)
+            processes.append(subtree['process'])
+            levels.append(level)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            if prev != -1:
+                next_sibling[prev] = node
+            elif parent != -1:
+                first_child[parent] = node
+            prev = node
+            if subtree['children']:
+                groups.append((subtree['children'], node, level + 1))
+    
+    return processes, levels, first_child, next_sibling
+
 class ProcessTreeFormatter:
     """Formateador para árboles de procesos."""
     
@@ -13,79 +51,64 @@ class ProcessTreeFormatter:
         if not tree:
             return "No hay procesos en el árbol"
         
-        result = "🌳 Árbol de Procesos\n"
-        result += "=" * 50 + "\n\n"
-        
-        for pid, subtree in tree.items():
-            result += ProcessTreeFormatter._format_subtree(subtree, 0, show_details)
-        
-        return result
-    
-    @staticmethod
-    def _format_subtree(subtree: Dict, level: int, show_details: bool) -> str:
-        """Formatea un subárbol recursivamente."""
-        if 'process' not in subtree:
-            return ""
-        
-        process = subtree['process']
-        indent = "  " * level
-        
-        # Símbolo del nodo
-        if level == 0:
-            symbol = "🔸"
-        else:
-            symbol = "├─"
+        parts = ["🌳 Árbol de Procesos\n", "=" * 50 + "\n\n"]
         
-        # Información básica
-        result = f"{indent}{symbol} PID {process.pid}: {process.name} [{process.state}]"
+        processes, levels, first_child, next_sibling = _to_soa(tree)
         
-        # Detalles adicionales si se solicitan
-        if show_details:
-            result += f" (Burst: {process.remaining_burst}/{process.total_burst})"
-            if process.parent_pid:
-                result += f" (Padre: {process.parent_pid})"
+        # DFS en preorden sólo con índices enteros: la pila guarda el hermano pendiente de cada rama
+        stack: List[int] = []
+        node = 0 if processes else -1
+        while node != -1:
+            process = processes[node]
+            level = levels[node]
+            indent = _indent(level)
+            
+            # Símbolo del nodo
+            symbol = "🔸" if level == 0 else "├─"
+            
+            # Información básica (fragmentos sueltos: se unen una sola vez al final)
+            parts.extend((indent, symbol, " PID ", str(process.pid), ": ", process.name, " [", process.state, "]"))
+            
+            # Detalles adicionales si se solicitan
+            if show_details:
+                parts.extend((" (Burst: ", str(process.remaining_burst), "/", str(process.total_burst), ")"))
+                if process.parent_pid:
+                    parts.extend((" (Padre: ", str(process.parent_pid), ")"))
+            
+            parts.append("\n")
+            
+            # Bajar al primer hijo o pasar al siguiente hermano
+            if first_child[node] != -1:
+                stack.append(next_sibling[node])
+                node = first_child[node]
+            else:
+                node = next_sibling[node]
+            while node == -1 and stack:
+                node = stack.pop()
         
-        result += "\n"
-        
-        # Procesar hijos
-        if subtree['children']:
-            for child_pid, child_subtree in subtree['children'].items():
-                result += ProcessTreeFormatter._format_subtree(child_subtree, level + 1, show_details)
-        
-        return result
+        return "".join(parts)
     
     @staticmethod
     def get_process_hierarchy(process_table: Dict[int, Process]) -> List[Dict]:
         """Obtiene la jerarquía de procesos como lista."""
-        hierarchy = []
+        # Una pasada crea los nodos planos; otra los enlaza (sin recursión)
+        nodes = {
+            pid: {'pid': process.pid, 'name': process.name, 'state': process.state, 'children': []}
+            for pid, process in process_table.items()
+        }
         
-        # Encontrar procesos raíz (sin padre o padre no existe)
-        root_processes = []
+        hierarchy = []
         for pid, process in process_table.items():
-            if process.parent_pid is None or process.parent_pid not in process_table:
-                root_processes.append(process)
-        
-        # Construir jerarquía para cada raíz
-        for root in root_processes:
-            hierarchy.append(ProcessTreeFormatter._build_hierarchy_node(root, process_table))
+            node = nodes[pid]
+            children = node['children']
+            for child_pid in process.children:
+                # Una sola búsqueda por arista
+                child = nodes.get(child_pid)
+                if child is not None:
+                    children.append(child)
+            
+            # Procesos raíz: sin padre o con un padre que no existe
+            if process.parent_pid is None or process.parent_pid not in nodes:
+                hierarchy.append(node)
         
         return hierarchy
-    
-    @staticmethod
-    def _build_hierarchy_node(process: Process, process_table: Dict[int, Process]) -> Dict:
-        """Construye un nodo de jerarquía."""
-        node = {
-            'pid': process.pid,
-            'name': process.name,
-            'state': process.state,
-            'children': []
-        }
-        
-        # Agregar hijos
-        for child_pid in process.children:
-            if child_pid in process_table:
-                child_process = process_table[child_pid]
-                child_node = ProcessTreeFormatter._build_hierarchy_node(child_process, process_table)
-                node['children'].append(child_node)
-        
-        return node
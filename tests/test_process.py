@@ -69,6 +69,15 @@ class TestProcess(unittest.TestCase):
         
         self.assertEqual(child.parent_pid, 1)
         self.assertIn(child.pid, parent.children)
+    
+    def test_identity_by_pid(self):
+        """Test de igualdad y hash basados en el PID."""
+        same = Process(pid=1, name="Otro", state="READY")
+        other = Process(pid=2, name="TestProcess")
+        
+        self.assertEqual(self.process, same)
+        self.assertNotEqual(self.process, other)
+        self.assertEqual(len({self.process, same, other}), 2)
 
 if __name__ == '__main__':
     unittest.main()
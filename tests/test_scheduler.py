@@ -2,7 +2,7 @@
 Tests unitarios para el planificador Round-Robin.
 """
 import unittest
-from src.core.scheduler import RoundRobinScheduler
+from src.core.scheduler import PriorityScheduler, RoundRobinScheduler
 from src.models.process import Process
 
 class TestRoundRobinScheduler(unittest.TestCase):
@@ -83,6 +83,89 @@ class TestRoundRobinScheduler(unittest.TestCase):
         self.assertIn(1, self.scheduler.ready_queue)
         self.assertIn(3, self.scheduler.ready_queue)
     
+    def test_removed_process_is_skipped(self):
+        """Test que un proceso removido no vuelve a planificarse."""
+        for pid in (1, 2, 3):
+            self.scheduler.add_to_ready(pid)
+        
+        self.scheduler.remove_from_ready(2)
+        
+        self.assertEqual(self.scheduler.get_next_process(), 1)
+        self.assertEqual(self.scheduler.get_next_process(), 3)
+        self.assertIsNone(self.scheduler.get_next_process())
+    
+    def test_readd_after_remove(self):
+        """Test de re-agregar un proceso removido de la cola."""
+        self.scheduler.add_to_ready(1)
+        self.scheduler.remove_from_ready(1)
+        self.scheduler.add_to_ready(2)
+        self.scheduler.add_to_ready(1)
+        self.scheduler.add_to_ready(1)  # Duplicado: se ignora
+        
+        self.assertEqual(self.scheduler.get_ready_count(), 2)
+        self.assertEqual(self.scheduler.get_next_process(), 2)
+        self.assertEqual(self.scheduler.get_next_process(), 1)
+        self.assertIsNone(self.scheduler.get_next_process())
+    
+    def test_priority_order(self):
+        """Test que se elige primero el nivel de mayor prioridad."""
+        scheduler = PriorityScheduler(quantum=3)
+        self.process_table[1].priority = 7
+        self.process_table[2].priority = 2
+        self.process_table[3].priority = 7
+        for pid in (1, 2, 3):
+            scheduler.add_to_ready(pid, self.process_table)
+        
+        self.assertEqual(scheduler.get_next_process(), 2)
+        self.assertEqual(scheduler.get_next_process(), 1)
+        self.assertEqual(scheduler.get_next_process(), 3)
+        self.assertIsNone(scheduler.get_next_process())
+    
+    def test_ready_queue_summary(self):
+        """Test del texto de colas de prioridad y su caché."""
+        scheduler = PriorityScheduler(quantum=3)
+        self.assertEqual(scheduler.get_ready_queue_summary(), "Vacía")
+        self.process_table[1].priority = 7
+        self.process_table[2].priority = 2
+        self.process_table[3].priority = 7
+        for pid in (1, 2, 3):
+            scheduler.add_to_ready(pid, self.process_table)
+        
+        summary = scheduler.get_ready_queue_summary()
+        self.assertEqual(summary, "P2:1, P7:2")
+        self.assertIs(scheduler.get_ready_queue_summary(), summary)
+        scheduler.remove_from_ready(2)
+        self.assertEqual(scheduler.get_ready_queue_summary(), "P7:2")
+    
+    def test_preemption_by_higher_priority(self):
+        """Test de preempción cuando espera un proceso de mayor prioridad."""
+        scheduler = PriorityScheduler(quantum=3)
+        self.process_table[1].priority = 5
+        self.process_table[2].priority = 1
+        scheduler.set_running(1, self.process_table)
+        
+        self.assertFalse(scheduler.preempt_current(self.process_table))
+        scheduler.add_to_ready(2, self.process_table)
+        self.assertTrue(scheduler.preempt_current(self.process_table))
+        self.assertEqual(scheduler.get_next_process(), 2)
+    
+    def test_priority_aging_keeps_ready_processes(self):
+        """Test que el aging solo cambia niveles sin perder procesos."""
+        scheduler = PriorityScheduler(quantum=3)
+        for pid in range(1, 21):
+            self.process_table[pid] = Process(pid=pid, name=f"P{pid}", state="READY", priority=9)
+            scheduler.add_to_ready(pid, self.process_table)
+        scheduler.remove_from_ready(4)
+        
+        scheduler._priority_aging(self.process_table)
+        
+        self.assertEqual(scheduler.get_ready_count(), 19)
+        self.assertEqual(sum(scheduler.get_ready_queue_info().values()), 19)
+        served = []
+        while (pid := scheduler.get_next_process()) is not None:
+            served.append(pid)
+        self.assertEqual(sorted(served), [pid for pid in range(1, 21) if pid != 4])
+    
     def test_scheduler_reset(self):
         """Test de reinicio del scheduler."""
         # Configurar estado
@@ -12,7 +12,10 @@ import sys
 import os
 
 # Agregar el directorio padre al path para importar el módulo principal
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# (la comprobación evita duplicar la entrada si el módulo se importa más de una vez)
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
 
 from simulador_procesos_customtk import SimulatorEngine, Process
 
@@ -52,6 +55,15 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertEqual(child.parent_pid, parent_pid)
         self.assertIn(child_pid, parent.children)
     
+    def test_root_pids_index(self):
+        """Test del índice de procesos raíz."""
+        parent_pid = self.engine.create_process("Padre")
+        child_pid = self.engine.create_process("Hijo", 5, parent_pid)
+        orphan_pid = self.engine.create_process("Huerfano", 5, 999)
+        
+        self.assertEqual(list(self.engine.root_pids), [parent_pid, orphan_pid])
+        self.assertNotIn(child_pid, self.engine.root_pids)
+    
     def test_move_new_to_ready(self):
         """Test movimiento de NEW a READY."""
         # Crear algunos procesos
@@ -88,6 +100,21 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertIn(pid, self.engine.blocked_list)
         self.assertEqual(process.blocked_count, 1)
     
+    def test_blocked_process_skipped_by_scheduler(self):
+        """Test que un proceso bloqueado desde READY no se planifica."""
+        self.engine.p_block = 0
+        pid1 = self.engine.create_process("P1", 10)
+        pid2 = self.engine.create_process("P2", 10)
+        self.engine.move_new_to_ready()
+        
+        self.engine.force_block_process(pid1, 5)
+        self.assertNotIn(pid1, list(self.engine.iter_ready()))
+        self.assertEqual(self.engine.get_metrics()['ready_queue_size'], 1)
+        
+        self.engine._schedule_processes()
+        self.assertEqual(self.engine.process_table[pid2].state, 'RUNNING')
+        self.assertEqual(self.engine.process_table[pid1].state, 'BLOCKED')
+    
     def test_force_terminate_process(self):
         """Test terminación forzada de procesos."""
         # Crear proceso
@@ -102,6 +129,20 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertIsNotNone(process.end_tick)
         self.assertIn(process.state, ['TERMINATED', 'ZOMBIE'])
     
+    def test_terminated_processes_archived(self):
+        """Test de separación entre procesos vivos y archivados."""
+        parent_pid = self.engine.create_process("Parent")
+        child_pid = self.engine.create_process("Child", parent_pid=parent_pid)
+        
+        self.engine.force_terminate_process(child_pid)  # Queda ZOMBIE: sigue vivo
+        self.assertIn(child_pid, self.engine.live)
+        self.engine.wait_for_child(parent_pid)
+        self.engine.force_terminate_process(parent_pid)
+        
+        self.assertEqual(list(self.engine.archived), [child_pid, parent_pid])
+        self.assertEqual(list(self.engine.live), [0])
+        self.assertIn(child_pid, self.engine.process_table)
+    
     def test_zombie_creation(self):
         """Test creación de procesos zombie."""
         # Crear padre e hijo
@@ -136,6 +177,19 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertTrue(child.reaped)
         self.assertNotIn(child_pid, self.engine.zombie_list)
     
+    def test_wait_reaps_only_zombie_children(self):
+        """Test que wait() solo reapea los hijos en estado ZOMBIE."""
+        parent_pid = self.engine.create_process("Padre")
+        zombie_pid = self.engine.create_process("Hijo1", 1, parent_pid)
+        alive_pid = self.engine.create_process("Hijo2", 5, parent_pid)
+        
+        self.engine.force_terminate_process(zombie_pid)
+        self.assertEqual(self.engine.wait_for_child(parent_pid), [zombie_pid])
+        self.assertEqual(self.engine.process_table[alive_pid].state, 'NEW')
+        
+        # Sin zombies pendientes, wait() no devuelve nada
+        self.assertEqual(self.engine.wait_for_child(parent_pid), [])
+    
     def test_blocked_process_unblocking(self):
         """Test desbloqueo automático de procesos."""
         # Crear y bloquear proceso
@@ -178,6 +232,66 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertEqual(self.engine.current_running_pid, pids[0])
         self.assertEqual(self.engine.process_table[pids[0]].state, 'RUNNING')
     
+    def test_quantum_preemption(self):
+        """Test preempción al agotar el quantum."""
+        self.engine.p_block = 0
+        self.engine.quantum = 2
+        pid1 = self.engine.create_process("P1", 10)
+        pid2 = self.engine.create_process("P2", 10)
+        self.engine.move_new_to_ready()
+        
+        self.engine._schedule_processes()
+        self.assertEqual(self.engine.current_running_pid, pid1)
+        self.engine._schedule_processes()
+        
+        # Tras dos sub-ticks P1 vuelve a READY y P2 toma la CPU
+        process = self.engine.process_table[pid1]
+        self.assertEqual(process.state, 'READY')
+        self.assertEqual(process.remaining_burst, 8)
+        self.assertEqual(process.preempt_count, 1)
+        self.engine._schedule_processes()
+        self.assertEqual(self.engine.current_running_pid, pid2)
+    
+    def test_version_bumps_on_changes(self):
+        """Test que la versión del motor cambia con cada modificación."""
+        version = self.engine.version
+        pid = self.engine.create_process("V")
+        self.assertGreater(self.engine.version, version)
+        
+        version = self.engine.version
+        self.assertFalse(self.engine.force_block_process(pid))  # NEW: no se bloquea
+        self.assertEqual(self.engine.version, version)
+        
+        self.engine.tick_simulation()
+        self.assertGreater(self.engine.version, version)
+    
+    def test_advance_auto_create(self):
+        """Test de avance por lotes con auto-creación."""
+        self.engine.p_create = 1.0
+        self.engine.advance(3, auto_create=True)
+        self.assertEqual(self.engine.tick, 3)
+        self.assertEqual(self.engine.get_metrics()['total_processes'], 3)
+        
+        self.engine.p_create = 0
+        self.engine.advance(5, auto_create=True)
+        self.assertEqual(self.engine.tick, 8)
+        self.assertEqual(self.engine.get_metrics()['total_processes'], 3)
+    
+    def test_auto_create_rate(self):
+        """Test que los saltos geométricos respetan p_create en promedio."""
+        self.engine.set_seed(7)
+        self.engine.p_create = 0.2
+        created = sum(self.engine._should_auto_create() for _ in range(20000))
+        self.assertAlmostEqual(created / 20000, 0.2, delta=0.02)
+    
+    def test_p_create_change_discards_drawn_gap(self):
+        """Test que cambiar p_create no arrastra el salto sorteado con el valor anterior."""
+        self.engine.set_seed(1)
+        self.engine.p_create = 0.0001
+        self.engine._should_auto_create()
+        self.engine.p_create = 1.0
+        self.assertTrue(self.engine._should_auto_create())
+    
     def test_metrics_calculation(self):
         """Test cálculo de métricas."""
         # Crear algunos procesos
@@ -198,6 +312,37 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertEqual(metrics['total_processes'], 3)
         self.assertEqual(metrics['context_switches'], 0)
         self.assertEqual(metrics['zombies_count'], 0)
+    
+    def test_recent_logs_formatted_lazily(self):
+        """Test formateo diferido de los eventos del log."""
+        self.engine.tick = 7
+        pid = self.engine.create_process("LogP", 4)
+        
+        self.assertEqual(self.engine.recent_logs(1),
+                         [f"[Tick 0007] Proceso LogP (PID {pid}) creado con burst 4"])
+        self.assertEqual(len(self.engine.recent_logs(10)), 2)  # init + LogP
+        
+        # Al superar la capacidad se conservan solo los eventos más recientes
+        for i in range(100):
+            self.engine.log_event("Evento %s", i)
+        self.assertEqual(self.engine.recent_logs(2),
+                         ["[Tick 0007] Evento 98", "[Tick 0007] Evento 99"])
+        self.assertEqual(len(self.engine.recent_logs(500)), 50)
+    
+    def test_turnaround_metrics_accumulated(self):
+        """Test acumulación de turnaround al terminar procesos."""
+        self.engine.tick = 2
+        pid = self.engine.create_process("P", 3)
+        self.engine.tick = 10
+        self.engine.force_terminate_process(pid)
+        
+        metrics = self.engine.get_metrics()
+        self.assertEqual(metrics['avg_turnaround'], 8)
+        self.assertEqual(metrics['avg_waiting'], 5)
+        
+        # Terminar de nuevo no debe contar dos veces
+        self.assertFalse(self.engine.force_terminate_process(pid))
+        self.assertEqual(self.engine.get_metrics()['avg_turnaround'], 8)
 
 class TestProcess(unittest.TestCase):
     """Tests para la clase Process."""
@@ -1,8 +1,13 @@
 """
 Tests unitarios para el motor de simulación.
 """
+import csv
+import os
+import tempfile
 import unittest
+from collections import deque
 from src.core.simulator import SimulatorEngine
+from src.utils.csv_exporter import CSVExporter
 
 class TestSimulatorEngine(unittest.TestCase):
     """Tests para el motor de simulación."""
@@ -71,6 +76,19 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertEqual(self.simulator.process_table[pid].io_remaining, 5)
         self.assertIn(pid, self.simulator.blocked_list)
     
+    def test_blocked_processes_unblock_in_order(self):
+        """Test de desbloqueo según el tiempo de E/S restante."""
+        pids = [self.simulator.create_process() for _ in range(3)]
+        self.simulator.move_new_to_ready()
+        for pid, io_time in zip(pids, (2, 1, 3)):
+            self.simulator.force_block_process(pid, io_time)
+        
+        self.simulator._handle_blocked_processes()
+        self.assertEqual(list(self.simulator.blocked_list), [pids[0], pids[2]])
+        self.simulator._handle_blocked_processes()
+        self.assertEqual(list(self.simulator.blocked_list), [pids[2]])
+        self.assertEqual(self.simulator.process_table[pids[1]].state, "READY")
+    
     def test_force_terminate_process(self):
         """Test de forzar terminación de proceso."""
         # Crear proceso
@@ -93,7 +111,7 @@ class TestSimulatorEngine(unittest.TestCase):
         # Hacer que el hijo sea zombie
         child = self.simulator.process_table[child_pid]
         child.state = "ZOMBIE"
-        self.simulator.zombie_list.append(child_pid)
+        self.simulator.zombie_list[child_pid] = None
         
         # Ejecutar wait
         reaped = self.simulator.wait_for_child(parent_pid)
@@ -104,6 +122,41 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertTrue(child.reaped)
         self.assertNotIn(child_pid, self.simulator.zombie_list)
     
+    def test_auto_reap_after_deadline(self):
+        """Test de auto-reap de zombies al cumplirse auto_reap_after."""
+        self.simulator.auto_reap_after = 3
+        parent_pid = self.simulator.create_process("Parent")
+        child_pid = self.simulator.create_process("Child", parent_pid=parent_pid)
+        self.simulator.force_terminate_process(child_pid)
+        self.assertIn(child_pid, self.simulator.zombie_list)
+        
+        for _ in range(2):
+            self.simulator.tick_simulation()
+        self.assertIn(child_pid, self.simulator.zombie_list)
+        self.simulator.tick_simulation()
+        self.assertNotIn(child_pid, self.simulator.zombie_list)
+        self.assertEqual(self.simulator.process_table[child_pid].state, "TERMINATED")
+        self.assertEqual(self.simulator._reap_heap, [])
+    
+    def test_reap_heap_bounded_without_auto_reap(self):
+        """Test que sin auto-reap el montículo no acumula zombies ya reapeados."""
+        self.simulator.auto_reap_after = 0
+        parent_pid = self.simulator.create_process("Parent")
+        for _ in range(200):
+            child_pid = self.simulator.create_process("Child", parent_pid=parent_pid)
+            self.simulator.force_terminate_process(child_pid)
+            self.simulator.wait_for_child(parent_pid)
+        self.assertEqual(self.simulator._reap_heap, [])
+        
+        # Al activarlo se programan los zombies pendientes
+        child_pid = self.simulator.create_process("Child", parent_pid=parent_pid)
+        self.simulator.force_terminate_process(child_pid)
+        self.simulator.auto_reap_after = 1
+        self.assertEqual(len(self.simulator._reap_heap), 1)
+        self.simulator.tick_simulation()
+        self.assertNotIn(child_pid, self.simulator.zombie_list)
+        self.assertEqual(self.simulator._reap_heap, [])
+    
     def test_tick_simulation(self):
         """Test de ejecución de tick de simulación."""
         initial_tick = self.simulator.tick
@@ -136,6 +189,131 @@ class TestSimulatorEngine(unittest.TestCase):
         for key in expected_keys:
             self.assertIn(key, metrics)
     
+    def test_metrics_cached_until_state_changes(self):
+        """Test de la caché de métricas invalidada por los mutadores."""
+        metrics = self.simulator.get_metrics()
+        self.assertIs(self.simulator.get_metrics(), metrics)
+        
+        self.simulator.create_process()
+        self.assertEqual(self.simulator.get_metrics()['total_processes'], 2)
+        
+        self.simulator.tick_simulation()
+        self.assertEqual(self.simulator.get_metrics()['tick'], 1)
+    
+    def test_average_metrics_match_finished_processes(self):
+        """Test de promedios incrementales de turnaround y espera."""
+        self.simulator.p_block = 0
+        for _ in range(4):
+            self.simulator.create_process(burst=3)
+        for _ in range(6):
+            self.simulator.tick_simulation()
+        self.simulator.force_terminate_process(4)
+        for _ in range(10):
+            self.simulator.tick_simulation()
+        
+        finished = [p for p in self.simulator.process_table.values() if p.is_finished() and p.pid != 0]
+        turnarounds = [p.get_turnaround_time() for p in finished]
+        waitings = [p.get_waiting_time() for p in finished if p.get_waiting_time() is not None]
+        metrics = self.simulator.get_metrics()
+        
+        self.assertEqual(len(finished), 4)
+        self.assertAlmostEqual(metrics['avg_turnaround'], sum(turnarounds) / len(turnarounds))
+        self.assertAlmostEqual(metrics['avg_waiting'], sum(waitings) / len(waitings))
+        for process in finished:
+            self.assertEqual(process.turnaround, process.get_turnaround_time())
+            self.assertEqual(process.waiting, process.get_waiting_time())
+    
+    def test_state_counts_follow_transitions(self):
+        """Test de contadores por estado mantenidos en cada transición."""
+        self.simulator.set_seed(3)
+        for _ in range(5):
+            self.simulator.create_process()
+        for tick in range(30):
+            if tick == 4:
+                self.simulator.force_terminate_process(2)
+            self.simulator.tick_simulation()
+            for state, count in self.simulator.state_counts.items():
+                actual = sum(1 for p in self.simulator.process_table.values() if p.state == state)
+                self.assertEqual(count, actual, state)
+    
+    def test_process_tree_deep_chain(self):
+        """Test del árbol de procesos con una cadena profunda de hijos."""
+        pid = self.simulator.create_process("Root")
+        for _ in range(2000):
+            pid = self.simulator.create_process(parent_pid=pid)
+        
+        tree = self.simulator.get_process_tree()
+        self.assertEqual(sorted(tree), [0, 1])
+        node, depth = tree[1], 0
+        while node['children']:
+            (node,) = node['children'].values()
+            depth += 1
+        self.assertEqual(depth, 2000)
+        self.assertEqual(node['process'].pid, pid)
+    
+    def test_block_rate(self):
+        """Test que los saltos geométricos respetan p_block en promedio."""
+        self.simulator.set_seed(11)
+        self.simulator.p_block = 0.1
+        blocked = sum(self.simulator._should_block() for _ in range(20000))
+        self.assertAlmostEqual(blocked / 20000, 0.1, delta=0.01)
+    
+    def test_p_block_change_discards_drawn_gap(self):
+        """Test que cambiar p_block no arrastra el salto sorteado con el valor anterior."""
+        self.simulator.set_seed(3)
+        self.simulator.p_block = 0.0001
+        self.simulator._should_block()
+        self.simulator.p_block = 1.0
+        self.assertTrue(self.simulator._should_block())
+    
+    def test_p_create_change_discards_drawn_gap(self):
+        """Test que cambiar p_create no arrastra el salto sorteado con el valor anterior."""
+        self.simulator.set_seed(3)
+        self.simulator.p_create = 0.0001
+        self.simulator._should_auto_create()
+        self.simulator.p_create = 1.0
+        self.assertTrue(self.simulator._should_auto_create())
+    
+    def test_advance_matches_single_ticks(self):
+        """Test de avance por lotes equivalente a ticks individuales."""
+        other = SimulatorEngine(seed=4)
+        self.simulator.set_seed(4)
+        for engine in (self.simulator, other):
+            engine.p_create = 0.02
+        
+        self.simulator.advance(2000, auto_create=True)
+        for _ in range(2000):
+            if other._should_auto_create():
+                other.create_process()
+            other.tick_simulation()
+        
+        self.assertEqual(self.simulator.tick, other.tick)
+        self.assertEqual(self.simulator.idle_ticks, other.idle_ticks)
+        self.assertEqual(
+            [(p.pid, p.state, p.remaining_burst) for p in self.simulator.process_table.values()],
+            [(p.pid, p.state, p.remaining_burst) for p in other.process_table.values()])
+    
+    def test_logs_formatted_on_demand(self):
+        """Test del log con formateo diferido."""
+        self.simulator.p_block = 0
+        self.simulator.create_process("Logged", 5)
+        self.simulator.tick_simulation()
+        
+        logs = self.simulator.get_logs()
+        self.assertEqual(logs[0], "[T000] Proceso init (PID 0) creado con prioridad máxima")
+        self.assertIn("[T000] Proceso Logged (PID 1) creado con burst 5, prioridad", logs[1])
+        self.assertEqual(logs[-1], "[T001] Proceso Logged (PID 1) ejecutándose")
+    
+    def test_seed_reproducible(self):
+        """Test de reproducibilidad con la semilla del motor."""
+        other = SimulatorEngine(seed=5)
+        self.simulator.set_seed(5)
+        for _ in range(5):
+            pid = self.simulator.create_process()
+            other.create_process()
+            self.assertEqual(self.simulator.process_table[pid].total_burst, other.process_table[pid].total_burst)
+            self.assertEqual(self.simulator.process_table[pid].priority, other.process_table[pid].priority)
+    
     def test_reset_simulator(self):
         """Test de reinicio del simulador."""
         # Crear algunos procesos y avanzar simulación
@@ -151,6 +329,46 @@ class TestSimulatorEngine(unittest.TestCase):
         self.assertEqual(self.simulator.pid_counter, 1)
         self.assertEqual(len(self.simulator.process_table), 1)  # Solo init
         self.assertIn(0, self.simulator.process_table)  # Proceso init
+        self.assertEqual(self.simulator.sorted_pids, [0])
+    
+    def test_sorted_pids_index(self):
+        """Test del índice ordenado de PIDs."""
+        self.simulator.create_process()
+        parent = self.simulator.create_process()
+        self.simulator.create_process(parent_pid=parent)
+        
+        self.assertEqual(self.simulator.sorted_pids, sorted(self.simulator.process_table))
+    
+    def _export_report_events(self, event_logs):
+        """Exporta un reporte completo y devuelve las filas de su sección de eventos."""
+        fd, filename = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        try:
+            CSVExporter.export_complete_report(
+                self.simulator.get_metrics(), self.simulator.process_table, event_logs, filename
+            )
+            with open(filename, newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+        finally:
+            os.remove(filename)
+        return rows[rows.index(["Evento"]) + 1:]
+    
+    def test_export_report_accepts_deque_log(self):
+        """Test de exportación del reporte completo con un log en deque."""
+        events = deque(f"evento {i}" for i in range(80))
+        rows = self._export_report_events(events)
+        self.assertEqual(rows, [[f"evento {i}"] for i in range(30, 80)])
+    
+    def test_export_report_with_engine_log(self):
+        """Test de exportación del reporte completo con el log real del motor."""
+        parent_pid = self.simulator.create_process("Parent")
+        self.simulator.create_process("Child", parent_pid=parent_pid)
+        self.simulator.tick_simulation()
+        
+        logs = self.simulator.event_logs
+        self.assertTrue(logs[0].startswith("[T000] "))
+        rows = self._export_report_events(logs)
+        self.assertEqual(rows, [[event] for event in self.simulator.get_logs()])
 
 if __name__ == '__main__':
     unittest.main()